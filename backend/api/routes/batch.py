@@ -1,6 +1,6 @@
 """Batch operations for analyzing multiple properties at once"""
 
-from flask import request
+from flask import current_app, request
 from flask_restx import Namespace, Resource, fields
 import concurrent.futures
 from typing import List, Dict
@@ -12,6 +12,8 @@ from backend.utils.exceptions import ValidationError
 
 batch_ns = Namespace("batch", description="Batch property operations")
 
+MAX_SUB_REQUESTS = 10
+
 # Request/Response models
 batch_request_model = batch_ns.model("BatchPropertyRequest", {
     "addresses": fields.List(fields.String, required=True, description="List of property addresses", max_items=100),
@@ -41,6 +43,64 @@ batch_response_model = batch_ns.model("BatchPropertyResponse", {
     "summary": fields.Raw(description="Aggregate statistics")
 })
 
+batch_requests_model = batch_ns.model("BatchRequests", {
+    "requests": fields.List(
+        fields.Raw,
+        required=True,
+        description='GET sub-requests: {"method": "GET", "path": "/market/trends", "params": {...}}',
+        max_items=MAX_SUB_REQUESTS
+    )
+})
+
+@batch_ns.route("/requests")
+class BatchRequests(Resource):
+    """Several read-only API calls in one round trip"""
+    
+    @batch_ns.doc("batch_requests")
+    @batch_ns.expect(batch_requests_model)
+    def post(self):
+        """Run GET sub-requests in parallel; responses come back in request order"""
+        data = request.get_json()
+        sub_requests = (data or {}).get("requests")
+        
+        # Validate input
+        if not sub_requests:
+            raise ValidationError("No requests provided")
+        
+        if len(sub_requests) > MAX_SUB_REQUESTS:
+            raise ValidationError(f"Maximum {MAX_SUB_REQUESTS} requests per batch")
+        
+        for sub in sub_requests:
+            if str(sub.get("method", "GET")).upper() != "GET":
+                raise ValidationError("Only GET requests can be batched")
+            path = sub.get("path")
+            if not isinstance(path, str) or not path.startswith("/") or path.startswith("/batch"):
+                raise ValidationError(f"Invalid request path: {path}")
+        
+        # Sub-requests go through the full WSGI stack as this client, so rate
+        # limits, auth and monitoring apply to each one
+        app = current_app._get_current_object()
+        api_root = request.path.rsplit("/batch", 1)[0]
+        headers = {name: request.headers[name] for name in ("Authorization",) if name in request.headers}
+        environ_base = {"REMOTE_ADDR": request.remote_addr}
+        
+        def dispatch(sub: Dict) -> Dict:
+            response = app.test_client().get(
+                api_root + sub["path"],
+                query_string=sub.get("params"),
+                headers=headers,
+                environ_base=environ_base
+            )
+            return {
+                "status": response.status_code,
+                "body": response.get_json(silent=True)
+            }
+        
+        with concurrent.futures.ThreadPoolExecutor(max_workers=len(sub_requests)) as executor:
+            responses = list(executor.map(dispatch, sub_requests))
+        
+        return {"responses": responses}
+
 @batch_ns.route("/analyze")
 class BatchPropertyAnalysis(Resource):
     """Batch property analysis endpoint"""
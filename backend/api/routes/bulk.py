@@ -29,6 +29,16 @@ bulk_analysis_request = bulk_ns.model("BulkAnalysisRequest", {
     )
 })
 
+bulk_compare_request = bulk_ns.model("BulkCompareRequest", {
+    "addresses": fields.List(
+        fields.String,
+        required=True,
+        description="List of 2-5 property addresses to compare",
+        min_items=2,
+        max_items=5
+    )
+})
+
 property_result_model = bulk_ns.model("PropertyResult", {
     "address": fields.String(description="Property address"),
     "success": fields.Boolean(description="Analysis success status"),
@@ -131,6 +141,24 @@ class BulkComparison(Resource):
         # Parse addresses
         addresses = [addr.strip() for addr in addresses_param.split(",")]
         
+        return self._compare(addresses)
+    
+    @bulk_ns.doc("compare_properties_post")
+    @bulk_ns.expect(bulk_compare_request)
+    def post(self):
+        """Quick comparison of 2-5 properties sent as a JSON list
+        
+        Unlike the GET form, addresses may contain commas.
+        """
+        data = request.get_json()
+        
+        if not data or "addresses" not in data:
+            raise ValidationError("Addresses list is required")
+        
+        return self._compare([addr.strip() for addr in data["addresses"]])
+    
+    def _compare(self, addresses: list) -> dict:
+        """Run the quick comparison shared by GET and POST"""
         if len(addresses) < 2:
             raise ValidationError("At least 2 addresses required for comparison")
         
@@ -1,10 +1,12 @@
 """Natural language query endpoint"""
 
-from flask import request
+import json
+
+from flask import Response, request, stream_with_context
 from flask_restx import Namespace, Resource, fields
 
 from backend.services.perplexity_client import PerplexityClient
-from backend.utils.exceptions import ValidationError
+from backend.utils.exceptions import HDIException, ValidationError
 
 query_ns = Namespace("query", description="Natural language query operations")
 
@@ -46,4 +48,34 @@ class NaturalLanguageQuery(Resource):
         # Execute query
         response = client.query(enhanced_query)
         
-        return response
\ No newline at end of file
+        return response
+
+@query_ns.route("/stream")
+class NaturalLanguageQueryStream(Resource):
+    """Streaming natural language query endpoint"""
+    
+    @query_ns.doc("natural_language_query_stream")
+    @query_ns.expect(query_request_model)
+    def post(self):
+        """Stream the answer to a natural language query as server-sent events"""
+        data = request.get_json()
+        
+        if not data or "query" not in data:
+            raise ValidationError("Query field is required")
+        
+        client = PerplexityClient()
+        enhanced_query = f"Houston, TX real estate: {data['query']}"
+        
+        def events():
+            try:
+                for event in client.query_stream(enhanced_query):
+                    yield f"data: {json.dumps(event)}\n\n"
+            except HDIException as e:
+                # Headers are already sent, so report the failure in-band
+                yield f"data: {json.dumps({'error': str(e)})}\n\n"
+        
+        return Response(
+            stream_with_context(events()),
+            mimetype="text/event-stream",
+            headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+        )
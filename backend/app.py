@@ -22,6 +22,8 @@ from backend.config.settings import settings
 from backend.api.routes import register_routes
 from backend.utils.exceptions import HDIException
 from backend.utils.monitoring import add_performance_monitoring, get_performance_report
+from backend.utils.json_provider import use_orjson
+from backend.utils.request_decompression import add_gzip_request_support
 
 # Configure structured logging
 structlog.configure(
@@ -51,6 +53,9 @@ def create_app(config_name: str = "development") -> Flask:
     app.config["SECRET_KEY"] = settings.SECRET_KEY
     app.config["DEBUG"] = settings.DEBUG
     
+    # Serialize jsonify() responses with orjson when it is installed
+    use_orjson(app)
+    
     # Configure CORS with specific origins for your frontend
     CORS(app, 
          origins=[
@@ -123,6 +128,9 @@ def create_app(config_name: str = "development") -> Flask:
     # Register routes
     register_routes(api)
     
+    # Accept gzip-compressed request bodies (large bulk uploads from the CLI)
+    add_gzip_request_support(app)
+    
     # Add performance monitoring
     add_performance_monitoring(app)
     
@@ -56,9 +56,14 @@ class Settings:
     CENSUS_API_KEY: Optional[str] = os.getenv("CENSUS_API_KEY") or None
     NOAA_API_KEY: Optional[str] = os.getenv("NOAA_API_KEY") or None
     
+    _validated: bool = False
+    
     @classmethod
     def validate(cls) -> None:
-        """Validate required settings"""
+        """Validate required settings; only the first successful call does the checks"""
+        if cls._validated:
+            return
+        
         if not cls.PERPLEXITY_API_KEY:
             raise ValueError("PERPLEXITY_API_KEY is required")
         
@@ -67,6 +72,8 @@ class Settings:
         
         if cls.DEPLOYMENT_MODE not in ["INTERNAL", "PRODUCTION"]:
             raise ValueError(f"Invalid DEPLOYMENT_MODE: {cls.DEPLOYMENT_MODE}")
+        
+        cls._validated = True
 
 # Create singleton instance
 settings = Settings()
\ No newline at end of file
@@ -0,0 +1,17 @@
+-- Precomputed geometry metrics for properties
+-- Run this once, then populate with: python -m backend.database.populate_geometry_metrics
+
+ALTER TABLE properties ADD COLUMN IF NOT EXISTS calc_area_sqft NUMERIC(15,2);
+ALTER TABLE properties ADD COLUMN IF NOT EXISTS calc_perimeter_ft NUMERIC(12,2);
+ALTER TABLE properties ADD COLUMN IF NOT EXISTS is_corner_lot BOOLEAN;
+ALTER TABLE properties ADD COLUMN IF NOT EXISTS regularity_score REAL;
+ALTER TABLE properties ADD COLUMN IF NOT EXISTS width_ft NUMERIC(10,1);
+ALTER TABLE properties ADD COLUMN IF NOT EXISTS depth_ft NUMERIC(10,1);
+ALTER TABLE properties ADD COLUMN IF NOT EXISTS orientation_degrees REAL;
+ALTER TABLE properties ADD COLUMN IF NOT EXISTS vertex_count INTEGER;
+
+-- Rows still waiting for the populate job
+CREATE INDEX IF NOT EXISTS idx_properties_geometry_metrics_pending ON properties(account_number)
+    WHERE calc_area_sqft IS NULL AND geometry_wkt IS NOT NULL;
+
+ANALYZE properties;
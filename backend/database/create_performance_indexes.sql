@@ -18,6 +18,13 @@ CREATE INDEX IF NOT EXISTS idx_properties_centroid ON properties(centroid_lat, c
 -- Spatial index for geometry (if PostGIS available)
 -- CREATE INDEX IF NOT EXISTS idx_properties_geometry ON properties USING GIST(geometry_wkt);
 
+-- Nearest-neighbor index without PostGIS (used by the value estimator's comparables search)
+CREATE EXTENSION IF NOT EXISTS cube;
+CREATE EXTENSION IF NOT EXISTS earthdistance;
+CREATE INDEX IF NOT EXISTS idx_properties_earth ON properties
+    USING gist(ll_to_earth(centroid_lat, centroid_lon))
+    WHERE centroid_lat IS NOT NULL AND centroid_lon IS NOT NULL;
+
 -- Property type filtering
 CREATE INDEX IF NOT EXISTS idx_properties_type ON properties(property_type);
 CREATE INDEX IF NOT EXISTS idx_properties_class ON properties(property_class);
@@ -42,6 +49,10 @@ CREATE INDEX IF NOT EXISTS idx_properties_valuable ON properties(account_number,
 CREATE INDEX IF NOT EXISTS idx_properties_commercial ON properties(account_number, property_address)
     WHERE property_class_desc LIKE '%Commercial%';
 
+-- Comparable-property lookups for value estimation (same type, valued, located)
+CREATE INDEX IF NOT EXISTS idx_properties_type_comparables ON properties(property_type, centroid_lat, centroid_lon)
+    WHERE total_value > 0 AND centroid_lat IS NOT NULL AND centroid_lon IS NOT NULL;
+
 -- Index for year built queries
 CREATE INDEX IF NOT EXISTS idx_properties_year_built ON properties(year_built)
     WHERE year_built IS NOT NULL AND year_built > 1900;
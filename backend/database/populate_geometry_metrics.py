@@ -0,0 +1,92 @@
+"""Populate precomputed geometry metric columns on the properties table
+
+Run after add_geometry_metrics.sql, and again whenever parcel geometry is
+reloaded:
+
+    python -m backend.database.populate_geometry_metrics
+"""
+
+import os
+import sys
+
+# Add the project root to Python path when run as a script
+project_root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
+
+from psycopg2.extras import execute_values
+import structlog
+
+from backend.database.connection_pool import db_pool
+from backend.utils.geometry import (
+    GEOMETRY_METRIC_COLUMNS,
+    enhance_many_with_geometry,
+    geometry_analysis_to_columns,
+)
+
+logger = structlog.get_logger(__name__)
+
+BATCH_SIZE = 1000
+
+def populate_batch(batch_size: int = BATCH_SIZE) -> int:
+    """Compute metrics for one batch of pending properties; returns rows updated"""
+    with db_pool.get_cursor() as cur:
+        cur.execute("""
+            SELECT account_number, property_address, geometry_wkt, centroid_lat
+            FROM properties
+            WHERE calc_area_sqft IS NULL
+            AND geometry_wkt IS NOT NULL
+            LIMIT %s
+        """, (batch_size,))
+        rows = cur.fetchall()
+        if not rows:
+            return 0
+
+        properties = [
+            {
+                'account_number': row['account_number'],
+                'property_address': row['property_address'] or '',
+                'geometry': {
+                    'wkt': row['geometry_wkt'],
+                    'centroid': {'lat': row['centroid_lat'] or 29.7604}
+                }
+            }
+            for row in rows
+        ]
+        enhance_many_with_geometry(properties)
+
+        values = []
+        for prop in properties:
+            columns = geometry_analysis_to_columns(prop.get('geometry_analysis'))
+            if columns is None:
+                # Unparseable or non-polygon geometry: mark as processed with zero area
+                columns = dict.fromkeys(GEOMETRY_METRIC_COLUMNS)
+                columns['calc_area_sqft'] = 0
+            values.append((prop['account_number'],) + tuple(columns[c] for c in GEOMETRY_METRIC_COLUMNS))
+
+        assignments = ', '.join(f"{c} = v.{c}" for c in GEOMETRY_METRIC_COLUMNS)
+        execute_values(cur, f"""
+            UPDATE properties AS p SET {assignments}
+            FROM (VALUES %s) AS v(account_number, {', '.join(GEOMETRY_METRIC_COLUMNS)})
+            WHERE p.account_number = v.account_number
+        """, values, template=(
+            "(%s, %s::numeric, %s::numeric, %s::boolean, %s::real, "
+            "%s::numeric, %s::numeric, %s::real, %s::integer)"
+        ))
+
+        return len(values)
+
+def populate_all(batch_size: int = BATCH_SIZE) -> int:
+    """Populate metrics for every pending property"""
+    total = 0
+    while True:
+        updated = populate_batch(batch_size)
+        if updated == 0:
+            break
+        total += updated
+        logger.info("Geometry metrics batch stored", batch=updated, total=total)
+    return total
+
+if __name__ == "__main__":
+    count = populate_all()
+    print(f"✓ Geometry metrics populated for {count} properties")
@@ -1,7 +1,7 @@
 """Perplexity API client for real-time Houston data"""
 
 import asyncio
-from typing import Optional, Dict, Any, List
+from typing import Optional, Dict, Any, List, Iterator
 import httpx
 from openai import OpenAI
 import structlog
@@ -47,16 +47,7 @@ class PerplexityClient:
             
             response = self.client.chat.completions.create(
                 model=self.model,
-                messages=[
-                    {
-                        "role": "system",
-                        "content": "You are a Houston real estate expert. Provide accurate, current data with sources."
-                    },
-                    {
-                        "role": "user",
-                        "content": prompt
-                    }
-                ],
+                messages=self._build_messages(prompt),
                 temperature=temperature,
                 stream=False
             )
@@ -103,6 +94,84 @@ class PerplexityClient:
             
             raise PerplexityAPIError(f"Perplexity API error: {str(e)}")
     
+    def query_stream(self, prompt: str, temperature: float = 0.1) -> Iterator[Dict[str, Any]]:
+        """
+        Stream a query to Perplexity API
+        
+        Args:
+            prompt: The query prompt
+            temperature: Response randomness (0.0-1.0)
+            
+        Yields:
+            {"delta": text} for each content chunk, then a final
+            {"done": True, "metadata": {...}} event
+        """
+        start_time = time.time()
+        
+        try:
+            logger.info("Streaming query to Perplexity", model=self.model)
+            
+            stream = self.client.chat.completions.create(
+                model=self.model,
+                messages=self._build_messages(prompt),
+                temperature=temperature,
+                stream=True
+            )
+            
+            tokens_used = 0
+            for chunk in stream:
+                # Usage arrives with the final chunk
+                if getattr(chunk, 'usage', None):
+                    tokens_used = chunk.usage.total_tokens
+                if chunk.choices and chunk.choices[0].delta.content:
+                    yield {"delta": chunk.choices[0].delta.content}
+            
+            query_cost = self._calculate_cost(tokens_used)
+            
+            # Update tracking
+            self.request_count += 1
+            self.total_cost += query_cost
+            
+            logger.info(
+                "Perplexity stream complete",
+                cost=query_cost,
+                tokens=tokens_used,
+                response_time=time.time() - start_time
+            )
+            
+            yield {
+                "done": True,
+                "metadata": {
+                    "model": self.model,
+                    "tokens_used": tokens_used,
+                    "cost": query_cost,
+                    "response_time": time.time() - start_time,
+                    "timestamp": datetime.utcnow().isoformat(),
+                    "request_count": self.request_count
+                }
+            }
+            
+        except Exception as e:
+            logger.error("Perplexity stream failed", error=str(e), model=self.model)
+            
+            if "rate_limit" in str(e).lower():
+                raise RateLimitError(f"Perplexity rate limit exceeded: {str(e)}")
+            
+            raise PerplexityAPIError(f"Perplexity API error: {str(e)}")
+    
+    def _build_messages(self, prompt: str) -> List[Dict[str, str]]:
+        """Chat messages for a Houston real estate prompt"""
+        return [
+            {
+                "role": "system",
+                "content": "You are a Houston real estate expert. Provide accurate, current data with sources."
+            },
+            {
+                "role": "user",
+                "content": prompt
+            }
+        ]
+    
     async def query_async(self, prompt: str, temperature: float = 0.1) -> Dict[str, Any]:
         """
         Make an asynchronous query to Perplexity API
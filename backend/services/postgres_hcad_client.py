@@ -10,7 +10,7 @@ import logging
 import structlog
 from backend.utils.cache import cached_property
 from backend.services.value_estimator import enhance_property_with_estimation
-from backend.utils.geometry import enhance_with_geometry_analysis
+from backend.utils.geometry import GEOMETRY_METRIC_COLUMNS, geometry_analysis_from_columns
 from backend.database.connection_pool import db_pool
 import urllib.parse
 
@@ -51,7 +51,7 @@ class PostgresHCADClient:
                     address_clean = address.strip().upper()
 
                     # First try exact match
-                    query = """
+                    query = f"""
                     SELECT 
                         account_number,
                         owner_name,
@@ -81,7 +81,8 @@ class PostgresHCADClient:
                         mail_city,
                         mail_state,
                         mail_zip,
-                        extra_data
+                        extra_data,
+                        {', '.join(GEOMETRY_METRIC_COLUMNS)}
                     FROM properties
                     WHERE UPPER(property_address) LIKE %(search_pattern)s
                     LIMIT 1
@@ -199,6 +200,11 @@ class PostgresHCADClient:
         if db_row.get('extra_data'):
             property_data['extra_data'] = db_row['extra_data']
         
+        # Precomputed geometry metrics (see backend/database/add_geometry_metrics.sql)
+        geometry_analysis = geometry_analysis_from_columns(db_row)
+        if geometry_analysis:
+            property_data['geometry_analysis'] = geometry_analysis
+        
         return property_data
 
     def search_by_account(self, account_number: str) -> Optional[Dict]:
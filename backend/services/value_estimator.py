@@ -1,22 +1,83 @@
 """Property value estimation service for $0 properties"""
 
 import psycopg2
-from psycopg2.extras import RealDictCursor
+import psycopg2.errors
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, List, Optional, Tuple
+import re
 import statistics
 import structlog
 from math import radians, cos, sin, asin, sqrt
 
 from backend.services.perplexity_client import PerplexityClient
+from backend.utils.cache import cached_property
 
 logger = structlog.get_logger(__name__)
 
+# Numbers in AI responses (commas are stripped before matching)
+_NUMBER_RE = re.compile(r'\d+(?:\.\d+)?')
+
+# Search radius for comparables, roughly the 0.02 degree box of the fallback query
+COMPARABLES_RADIUS_METERS = 2200
+
+# Uses the GiST index on ll_to_earth(centroid_lat, centroid_lon) from
+# backend/database/create_performance_indexes.sql
+_EARTHDISTANCE_COMPARABLES_QUERY = """
+SELECT 
+    property_address,
+    total_value,
+    area_sqft,
+    year_built,
+    centroid_lat,
+    centroid_lon,
+    earth_distance(ll_to_earth(%(lat)s, %(lon)s),
+                   ll_to_earth(centroid_lat, centroid_lon)) / 1609.344 AS distance_miles
+FROM properties
+WHERE property_type = %(property_type)s
+AND total_value > 0
+AND centroid_lat IS NOT NULL
+AND centroid_lon IS NOT NULL
+AND earth_box(ll_to_earth(%(lat)s, %(lon)s), %(radius_meters)s) @> ll_to_earth(centroid_lat, centroid_lon)
+AND earth_distance(ll_to_earth(%(lat)s, %(lon)s),
+                   ll_to_earth(centroid_lat, centroid_lon)) < %(radius_meters)s
+ORDER BY distance_miles
+LIMIT %(limit)s
+"""
+
+# Row of the comparables query, in SELECT column order
+ComparableProperty = namedtuple('ComparableProperty', [
+    'property_address', 'total_value', 'area_sqft', 'year_built',
+    'centroid_lat', 'centroid_lon', 'distance_miles'
+])
+
 class PropertyValueEstimator:
     """Estimates property values using nearest neighbors and AI"""
     
+    # Cleared the first time the earthdistance extension turns out to be missing
+    _use_earthdistance = True
+    
     def __init__(self, db_url: str):
         self.db_url = db_url
-        self.perplexity = PerplexityClient()
+        self._perplexity: Optional[PerplexityClient] = None
+        # Shared by every request using this estimator; it only runs the short
+        # comparables query, so slow AI calls never queue behind each other
+        self.executor = ThreadPoolExecutor(max_workers=4)
+    
+    @property
+    def perplexity(self) -> PerplexityClient:
+        """Perplexity client, created on first AI estimate"""
+        if self._perplexity is None:
+            self._perplexity = PerplexityClient()
+        return self._perplexity
+    
+    @staticmethod
+    def get_coordinates(property_data: Dict) -> Tuple[Optional[float], Optional[float]]:
+        """Get property lat/lon from top-level fields or geometry centroid"""
+        centroid = property_data.get('geometry', {}).get('centroid', {})
+        lat = property_data.get('latitude') or centroid.get('lat')
+        lon = property_data.get('longitude') or centroid.get('lon')
+        return lat, lon
         
     def estimate_property_value(self, property_data: Dict) -> Dict:
         """
@@ -32,36 +93,72 @@ class PropertyValueEstimator:
                 'method': 'actual'
             }
         
+        return self._estimate_missing_value(property_data)
+    
+    def _estimate_cache_key(self, property_data: Dict) -> Tuple:
+        """Cache key for estimates: location to ~110 m, property type and size to 100 sqft"""
+        lat, lon = self.get_coordinates(property_data)
+        if lat and lon:
+            location = (round(lat, 3), round(lon, 3))
+        else:
+            # Without coordinates only the AI estimate runs, which is per address
+            location = property_data.get('property_address', '')
+        
+        return (
+            self.db_url,
+            location,
+            property_data.get('property_type', ''),
+            round(property_data.get('building_sqft', 0) or 0, -2)
+        )
+    
+    # no_estimate results often come from a transient AI or database failure, so they are not cached
+    @cached_property(ttl_seconds=3600, key_func=_estimate_cache_key, mark_hits=True,
+                     cache_if=lambda result: result.get('method') != 'no_estimate')
+    def _estimate_missing_value(self, property_data: Dict) -> Dict:
+        """Estimate from comparables and AI; nearby similar properties share a cached result"""
         # Get property details
-        lat = property_data.get('latitude') or property_data.get('geometry', {}).get('centroid', {}).get('lat')
-        lon = property_data.get('longitude') or property_data.get('geometry', {}).get('centroid', {}).get('lon')
+        lat, lon = self.get_coordinates(property_data)
         property_type = property_data.get('property_type', '')
         address = property_data.get('property_address', '')
         sqft = property_data.get('building_sqft', 0)
         
-        # Method 1: Find nearest similar properties
-        comparables = self._find_comparable_properties(
-            lat, lon, property_type, 
+        # Method 1: Find nearest similar properties. The query runs in the pool
+        # while the AI estimate below runs on this thread, so the two overlap
+        comparables_future = self.executor.submit(
+            self._find_comparable_properties,
+            lat, lon, property_type,
             property_data.get('property_class', ''),
             limit=10
         )
         
+        # Method 2: AI verification and enhancement
+        ai_estimate = None
+        ai_confidence = 0
+        
+        if address:
+            ai_result = self._get_ai_estimate(address, property_data, None)
+            if ai_result:
+                ai_estimate = ai_result['estimate']
+                ai_confidence = ai_result['confidence']
+        
+        comparables = comparables_future.result()
+        
         neighbor_estimate = None
         neighbor_confidence = 0
         
         if comparables:
             # Calculate estimate from neighbors
-            values = [c['total_value'] for c in comparables if c['total_value'] > 0]
+            values = [c.total_value for c in comparables if c.total_value > 0]
             if values:
                 # Use median for robustness
                 neighbor_estimate = statistics.median(values)
                 
                 # Adjust for square footage if available
-                if sqft > 0 and comparables[0].get('area_sqft', 0) > 0:
+                if sqft > 0 and (comparables[0].area_sqft or 0) > 0:
                     avg_price_per_sqft = statistics.mean([
-                        c['total_value'] / c['area_sqft'] 
+                        c.total_value / c.area_sqft 
                         for c in comparables 
-                        if c['total_value'] > 0 and c['area_sqft'] > 0
+                        if c.total_value > 0 and (c.area_sqft or 0) > 0
                     ])
                     sqft_based_estimate = avg_price_per_sqft * sqft
                     # Blend estimates
@@ -70,16 +167,6 @@ class PropertyValueEstimator:
                 # Calculate confidence based on data quality
                 neighbor_confidence = min(0.8, len(values) / 10)  # Max 0.8 confidence
         
-        # Method 2: AI verification and enhancement
-        ai_estimate = None
-        ai_confidence = 0
-        
-        if address:
-            ai_result = self._get_ai_estimate(address, property_data, comparables)
-            if ai_result:
-                ai_estimate = ai_result['estimate']
-                ai_confidence = ai_result['confidence']
-        
         # Combine estimates
         final_estimate, final_confidence, method = self._combine_estimates(
             neighbor_estimate, neighbor_confidence,
@@ -98,9 +185,9 @@ class PropertyValueEstimator:
                 'ai_based': ai_estimate,
                 'comparable_properties': [
                     {
-                        'address': c['property_address'],
-                        'value': c['total_value'],
-                        'distance_miles': c['distance_miles']
+                        'address': c.property_address,
+                        'value': c.total_value,
+                        'distance_miles': c.distance_miles
                     } for c in comparables[:5]
                 ] if comparables else []
             }
@@ -115,14 +202,31 @@ class PropertyValueEstimator:
     
     def _find_comparable_properties(self, lat: float, lon: float, 
                                    property_type: str, property_class: str,
-                                   limit: int = 10) -> List[Dict]:
+                                   limit: int = 10) -> List[ComparableProperty]:
         """Find nearest similar properties with values"""
         if not lat or not lon:
             return []
         
         try:
             with psycopg2.connect(self.db_url) as conn:
-                with conn.cursor(cursor_factory=RealDictCursor) as cur:
+                with conn.cursor() as cur:
+                    if PropertyValueEstimator._use_earthdistance:
+                        try:
+                            # Indexed bounding-cube search (cube + earthdistance extensions)
+                            cur.execute(_EARTHDISTANCE_COMPARABLES_QUERY, {
+                                'lat': lat,
+                                'lon': lon,
+                                'property_type': property_type,
+                                'radius_meters': COMPARABLES_RADIUS_METERS,
+                                'limit': limit
+                            })
+                            return list(map(ComparableProperty._make, cur.fetchall()))
+                        except psycopg2.errors.UndefinedFunction:
+                            conn.rollback()
+                            PropertyValueEstimator._use_earthdistance = False
+                            logger.info("earthdistance extension unavailable, "
+                                        "using lat/lon box for comparables")
+                    
                     # Query for nearby properties of same type
                     query = """
                     SELECT 
@@ -151,15 +255,14 @@ class PropertyValueEstimator:
                         lat, lat, lon, lon, limit
                     ))
                     
-                    results = cur.fetchall()
-                    return [dict(row) for row in results]
+                    return list(map(ComparableProperty._make, cur.fetchall()))
                     
         except Exception as e:
             logger.error(f"Error finding comparables: {str(e)}")
             return []
     
     def _get_ai_estimate(self, address: str, property_data: Dict, 
-                        comparables: List[Dict]) -> Optional[Dict]:
+                        comparables: Optional[List[ComparableProperty]]) -> Optional[Dict]:
         """Get AI-based estimate using Perplexity"""
         try:
             # Build context for AI
@@ -175,7 +278,7 @@ class PropertyValueEstimator:
                 context_parts.append(f"Built: {property_data['year_built']}")
             
             if comparables:
-                avg_comp_value = statistics.mean([c['total_value'] for c in comparables[:5]])
+                avg_comp_value = statistics.mean([c.total_value for c in comparables[:5]])
                 context_parts.append(f"Nearby similar properties average: ${avg_comp_value:,.0f}")
             
             context = ". ".join(context_parts)
@@ -194,20 +297,15 @@ class PropertyValueEstimator:
                 # Extract number from response
                 response_text = result.get('data', '')
                 
-                # Try to extract a number
-                import re
-                numbers = re.findall(r'\d+(?:,\d+)*(?:\.\d+)?', response_text.replace(',', ''))
-                
-                if numbers:
-                    # Take the first reasonable number (likely the estimate)
-                    for num_str in numbers:
-                        num = float(num_str)
-                        if 10000 < num < 100000000:  # Reasonable property value range
-                            return {
-                                'estimate': num,
-                                'confidence': 0.7,  # AI estimates get 0.7 confidence
-                                'source': 'perplexity'
-                            }
+                # Take the first reasonable number (likely the estimate)
+                for match in _NUMBER_RE.finditer(response_text.replace(',', '')):
+                    num = float(match.group())
+                    if 10000 < num < 100000000:  # Reasonable property value range
+                        return {
+                            'estimate': num,
+                            'confidence': 0.7,  # AI estimates get 0.7 confidence
+                            'source': 'perplexity'
+                        }
             
         except Exception as e:
             logger.error(f"AI estimation error: {str(e)}")
@@ -253,10 +351,39 @@ class PropertyValueEstimator:
         return final_est, final_conf, method
 
 
+# Estimators are stateless apart from their lazily created Perplexity client,
+# so one instance per database is shared across requests
+_estimators: Dict[str, PropertyValueEstimator] = {}
+
+def get_value_estimator(db_url: str) -> PropertyValueEstimator:
+    """Get the shared estimator for a database URL"""
+    estimator = _estimators.get(db_url)
+    if estimator is None:
+        estimator = _estimators.setdefault(db_url, PropertyValueEstimator(db_url))
+    return estimator
+
+
 def enhance_property_with_estimation(property_data: Dict, db_url: str) -> Dict:
     """Helper function to enhance property data with value estimation if needed"""
     if property_data.get('market_value', 0) == 0:
-        estimator = PropertyValueEstimator(db_url)
+        lat, lon = PropertyValueEstimator.get_coordinates(property_data)
+        if not (lat and lon) and not property_data.get('property_address'):
+            # Neither comparables nor AI can run - skip building an estimator
+            property_data['value_estimation'] = {
+                'estimated': True,
+                'value': 0,
+                'confidence': 0,
+                'method': 'no_estimate',
+                'comparables_used': 0,
+                'estimation_details': {
+                    'neighbor_based': None,
+                    'ai_based': None,
+                    'comparable_properties': []
+                }
+            }
+            return property_data
+        
+        estimator = get_value_estimator(db_url)
         estimation = estimator.estimate_property_value(property_data)
         
         # Add estimation to property data
@@ -1,58 +1,115 @@
 """In-memory caching system for HDI platform"""
 
+from collections import OrderedDict
 from functools import lru_cache, wraps
-from datetime import datetime, timedelta
+from itertools import islice
 import hashlib
-import json
-from typing import Any, Optional, Dict
+import sys
+import threading
+from typing import Any, Callable, Optional, Dict, Tuple
 import time
 
-class InMemoryCache:
-    """Simple in-memory cache with TTL support"""
+class _CacheShard:
+    """One partition of an InMemoryCache with its own lock and counters"""
     
     def __init__(self):
-        self._cache: Dict[str, Dict[str, Any]] = {}
-        self._access_count = 0
-        self._hit_count = 0
+        self.lock = threading.Lock()
+        # Entries are (value, expires_at) with expires_at on the time.monotonic() clock,
+        # ordered from least to most recently used
+        self.entries: "OrderedDict[str, Tuple[Any, float]]" = OrderedDict()
+        self.access_count = 0
+        self.hit_count = 0
+
+class InMemoryCache:
+    """Thread-safe in-memory cache with TTL support and LRU eviction
+    
+    Keys are partitioned across shards by hash, each guarded by its own
+    lock, so concurrent requests only contend when they hit the same shard.
+    """
+    
+    def __init__(self, max_entries: int = 10000, num_shards: int = 16):
+        self.max_entries = max_entries
+        self._shards = [_CacheShard() for _ in range(num_shards)]
+        self._shard_max_entries = max(1, max_entries // num_shards)
+    
+    def _shard(self, key: str) -> _CacheShard:
+        return self._shards[hash(key) % len(self._shards)]
         
     def get(self, key: str) -> Optional[Any]:
         """Get value from cache if not expired"""
-        self._access_count += 1
-        
-        if key in self._cache:
-            entry = self._cache[key]
-            if datetime.now() < entry['expires_at']:
-                self._hit_count += 1
-                return entry['value']
-            else:
-                # Expired, remove it
-                del self._cache[key]
+        shard = self._shard(key)
+        with shard.lock:
+            shard.access_count += 1
+            
+            entry = shard.entries.get(key)
+            if entry is not None:
+                if time.monotonic() < entry[1]:
+                    shard.hit_count += 1
+                    shard.entries.move_to_end(key)
+                    return entry[0]
+                else:
+                    # Expired, remove it
+                    del shard.entries[key]
         
         return None
     
     def set(self, key: str, value: Any, ttl_seconds: int = 3600):
-        """Set value in cache with TTL"""
-        self._cache[key] = {
-            'value': value,
-            'expires_at': datetime.now() + timedelta(seconds=ttl_seconds),
-            'created_at': datetime.now()
-        }
+        """Set value in cache with TTL, evicting least recently used entries"""
+        shard = self._shard(key)
+        with shard.lock:
+            shard.entries[key] = (value, time.monotonic() + ttl_seconds)
+            shard.entries.move_to_end(key)
+            while len(shard.entries) > self._shard_max_entries:
+                shard.entries.popitem(last=False)
     
     def clear_expired(self):
         """Remove all expired entries"""
-        now = datetime.now()
-        expired_keys = [k for k, v in self._cache.items() if now >= v['expires_at']]
-        for key in expired_keys:
-            del self._cache[key]
+        for shard in self._shards:
+            with shard.lock:
+                now = time.monotonic()
+                expired_keys = [k for k, v in shard.entries.items() if now >= v[1]]
+                for key in expired_keys:
+                    del shard.entries[key]
+    
+    @property
+    def _hit_count(self) -> int:
+        return sum(shard.hit_count for shard in self._shards)
+    
+    @property
+    def _access_count(self) -> int:
+        return sum(shard.access_count for shard in self._shards)
+    
+    def _estimate_memory_bytes(self, sample_size: int = 20) -> int:
+        """Estimate cache memory from a small sample of entries"""
+        total_entries = 0
+        sample = []
+        for shard in self._shards:
+            with shard.lock:
+                total_entries += len(shard.entries)
+                if len(sample) < sample_size:
+                    sample.extend(islice(shard.entries.items(), sample_size - len(sample)))
+        
+        base_bytes = sum(sys.getsizeof(shard.entries) for shard in self._shards)
+        if not sample:
+            return base_bytes
+        
+        sample_bytes = sum(
+            sys.getsizeof(key) + sys.getsizeof(entry) + sys.getsizeof(entry[0])
+            for key, entry in sample
+        )
+        return base_bytes + (sample_bytes * total_entries) // len(sample)
     
     def get_stats(self) -> Dict[str, Any]:
         """Get cache statistics"""
+        access_count = self._access_count
+        hit_count = self._hit_count
         return {
-            'total_entries': len(self._cache),
-            'access_count': self._access_count,
-            'hit_count': self._hit_count,
-            'hit_rate': self._hit_count / self._access_count if self._access_count > 0 else 0,
-            'memory_estimate_mb': len(str(self._cache)) / 1024 / 1024
+            'total_entries': sum(len(shard.entries) for shard in self._shards),
+            'max_entries': self.max_entries,
+            'access_count': access_count,
+            'hit_count': hit_count,
+            'hit_rate': hit_count / access_count if access_count > 0 else 0,
+            'memory_estimate_mb': self._estimate_memory_bytes() / 1024 / 1024
         }
 
 # Global cache instances
@@ -61,29 +118,55 @@ perplexity_cache = InMemoryCache()
 
 def cache_key(*args, **kwargs) -> str:
     """Generate cache key from arguments"""
-    key_data = {
-        'args': args,
-        'kwargs': sorted(kwargs.items())
-    }
-    key_string = json.dumps(key_data, sort_keys=True)
-    return hashlib.md5(key_string.encode()).hexdigest()
+    # BLAKE2b over the raw argument bytes - strings (e.g. long prompts) are
+    # hashed directly, everything else via repr, so nothing is re-serialized.
+    # Each part is prefixed with its type and byte length, so no two argument
+    # lists hash the same bytes
+    hasher = hashlib.blake2b(digest_size=16)
+    
+    def add(tag: bytes, data: bytes):
+        hasher.update(tag)
+        hasher.update(len(data).to_bytes(8, 'little'))
+        hasher.update(data)
+    
+    for arg in args:
+        if isinstance(arg, str):
+            add(b's', arg.encode())
+        else:
+            add(b'r', repr(arg).encode())
+    if kwargs:
+        add(b'k', repr(sorted(kwargs.items())).encode())
+    return hasher.hexdigest()
 
-def cached_property(ttl_seconds: int = 3600):
-    """Decorator for caching property data"""
+def cached_property(ttl_seconds: int = 3600, key_func: Optional[Callable[..., tuple]] = None,
+                    mark_hits: bool = False, cache_if: Optional[Callable[[Any], bool]] = None):
+    """Decorator for caching property data
+    
+    key_func, if given, receives the call arguments and returns the tuple to
+    key on (e.g. quantized coordinates) instead of the raw arguments. With
+    mark_hits, dict results served from cache are returned as a copy with
+    from_cache=True. cache_if, if given, must return True for a result to be
+    cached, so failed lookups can be retried on the next call.
+    """
     def decorator(func):
         @wraps(func)
         def wrapper(*args, **kwargs):
             # Generate cache key
-            key = cache_key(*args, **kwargs)
+            if key_func is not None:
+                key = cache_key(func.__qualname__, *key_func(*args, **kwargs))
+            else:
+                key = cache_key(*args, **kwargs)
             
             # Check cache
             cached_value = property_cache.get(key)
             if cached_value is not None:
+                if mark_hits and isinstance(cached_value, dict):
+                    return {**cached_value, 'from_cache': True}
                 return cached_value
             
             # Call function and cache result
             result = func(*args, **kwargs)
-            if result is not None:
+            if result is not None and (cache_if is None or cache_if(result)):
                 property_cache.set(key, result, ttl_seconds)
             
             return result
@@ -1,10 +1,20 @@
 """Geometry utilities for property analysis"""
 
+import numpy as np
+import shapely
 from shapely import wkt
 from shapely.geometry import Polygon, Point
+from functools import lru_cache
 from typing import Dict, Optional, Tuple, List
 import math
 
+FEET_PER_DEGREE_LAT = 364000  # feet per degree latitude
+
+@lru_cache(maxsize=256)
+def _lon_scale_for_lat(lat_bucket: int) -> float:
+    """Feet per degree longitude for a latitude bucket (hundredths of a degree)"""
+    return FEET_PER_DEGREE_LAT * math.cos(math.radians(lat_bucket / 100))
+
 def calculate_geometry_fields(property_data: Dict) -> Dict:
     """Calculate additional fields from geometry data"""
     geometry_data = property_data.get('geometry', {})
@@ -16,50 +26,7 @@ def calculate_geometry_fields(property_data: Dict) -> Dict:
     try:
         # Parse WKT to shapely geometry
         shape = wkt.loads(wkt_string)
-        
-        # Calculate area in square feet
-        if isinstance(shape, Polygon):
-            # Project to local coordinate system for accurate area
-            # Using simple approximation for Houston area
-            lat = geometry_data.get('centroid', {}).get('lat', 29.7604)
-            
-            # Convert to feet (approximation for Houston latitude)
-            lat_to_feet = 364000  # feet per degree latitude
-            lon_to_feet = 364000 * math.cos(math.radians(lat))
-            
-            # Calculate area
-            coords = list(shape.exterior.coords)
-            area_sqft = calculate_polygon_area(coords, lat_to_feet, lon_to_feet)
-            
-            # Calculate perimeter
-            perimeter_ft = calculate_polygon_perimeter(coords, lat_to_feet, lon_to_feet)
-            
-            # Determine if corner lot
-            is_corner = detect_corner_lot(shape, property_data.get('property_address', ''))
-            
-            # Calculate lot dimensions (approximate)
-            dimensions = estimate_lot_dimensions(shape, area_sqft)
-            
-            # Add calculated fields
-            property_data['geometry_analysis'] = {
-                'calculated_area_sqft': round(area_sqft, 2),
-                'calculated_perimeter_ft': round(perimeter_ft, 2),
-                'is_corner_lot': is_corner,
-                'estimated_dimensions': dimensions,
-                'shape_type': 'polygon',
-                'vertex_count': len(coords) - 1,  # Minus 1 because first/last are same
-                'regularity_score': calculate_regularity(shape)
-            }
-            
-            # Compare with recorded area if available
-            if property_data.get('land_sqft', 0) > 0:
-                area_diff = abs(area_sqft - property_data['land_sqft'])
-                property_data['geometry_analysis']['area_accuracy'] = {
-                    'recorded_sqft': property_data['land_sqft'],
-                    'calculated_sqft': area_sqft,
-                    'difference_sqft': area_diff,
-                    'difference_percent': (area_diff / property_data['land_sqft']) * 100
-                }
+        _apply_shape_analysis(property_data, shape)
         
     except Exception as e:
         property_data['geometry_analysis'] = {
@@ -68,49 +35,98 @@ def calculate_geometry_fields(property_data: Dict) -> Dict:
     
     return property_data
 
-def calculate_polygon_area(coords: List[Tuple[float, float]], 
-                          lat_scale: float, lon_scale: float) -> float:
-    """Calculate area of polygon using shoelace formula"""
-    area = 0.0
-    n = len(coords)
+def _apply_shape_analysis(property_data: Dict, shape,
+                          min_rect: Optional[Polygon] = None,
+                          shape_area: Optional[float] = None) -> None:
+    """Populate geometry_analysis for an already-parsed shape"""
+    geometry_data = property_data.get('geometry', {})
     
-    for i in range(n - 1):
-        lon1, lat1 = coords[i]
-        lon2, lat2 = coords[i + 1]
+    # Calculate area in square feet
+    if isinstance(shape, Polygon):
+        # Project to local coordinate system for accurate area
+        # Using simple approximation for Houston area
+        lat = geometry_data.get('centroid', {}).get('lat', 29.7604)
+        
+        # Convert to feet (approximation for Houston latitude)
+        lat_to_feet = FEET_PER_DEGREE_LAT
+        lon_to_feet = _lon_scale_for_lat(round(lat * 100))
+        
+        # Calculate area and perimeter from the exterior ring's coordinate array
+        coords = shapely.get_coordinates(shape.exterior)
+        area_sqft, perimeter_ft = _analyze_polygon(coords, lat_to_feet, lon_to_feet)
+        
+        # Minimum bounding rectangle is shared by all shape metrics below
+        if min_rect is None:
+            min_rect = shape.minimum_rotated_rectangle
+        if shape_area is None:
+            shape_area = shape.area
+        regularity = calculate_regularity(shape, min_rect, shape_area)
         
-        # Convert to feet
-        x1 = lon1 * lon_scale
-        y1 = lat1 * lat_scale
-        x2 = lon2 * lon_scale
-        y2 = lat2 * lat_scale
+        # Determine if corner lot
+        is_corner = detect_corner_lot(shape, property_data.get('property_address', ''),
+                                      min_rect, regularity)
+        
+        # Calculate lot dimensions and orientation (approximate)
+        mbr_analysis = analyze_mbr(min_rect)
+        dimensions = estimate_lot_dimensions(shape, area_sqft, min_rect, mbr_analysis)
+        orientation = round(mbr_analysis[2], 1) if mbr_analysis is not None else 0.0
+        
+        # Add calculated fields
+        property_data['geometry_analysis'] = {
+            'calculated_area_sqft': round(area_sqft, 2),
+            'calculated_perimeter_ft': round(perimeter_ft, 2),
+            'is_corner_lot': is_corner,
+            'estimated_dimensions': dimensions,
+            'orientation_degrees': orientation,
+            'shape_type': 'polygon',
+            'vertex_count': len(coords) - 1,  # Minus 1 because first/last are same
+            'regularity_score': regularity
+        }
         
-        area += (x1 * y2 - x2 * y1)
+        # Compare with recorded area if available
+        if property_data.get('land_sqft', 0) > 0:
+            area_diff = abs(area_sqft - property_data['land_sqft'])
+            property_data['geometry_analysis']['area_accuracy'] = {
+                'recorded_sqft': property_data['land_sqft'],
+                'calculated_sqft': area_sqft,
+                'difference_sqft': area_diff,
+                'difference_percent': (area_diff / property_data['land_sqft']) * 100
+            }
+
+def _analyze_polygon(coords_xy: np.ndarray, lat_scale: float,
+                     lon_scale: float) -> Tuple[float, float]:
+    """Area (shoelace) and perimeter in feet of a closed lon/lat ring as an (n, 2) array"""
+    # An empty ring (POLYGON EMPTY) has no first vertex to shift to
+    if len(coords_xy) == 0:
+        return 0.0, 0.0
+    
+    # Shift to the first vertex so the shoelace products stay small (the
+    # raw Houston lon/lat in feet lose precision to cancellation)
+    x = (coords_xy[:, 0] - coords_xy[0, 0]) * lon_scale
+    y = (coords_xy[:, 1] - coords_xy[0, 1]) * lat_scale
     
-    return abs(area) / 2.0
+    area = abs(np.dot(x[:-1], y[1:]) - np.dot(x[1:], y[:-1])) / 2.0
+    perimeter = np.hypot(np.diff(x), np.diff(y)).sum()
+    
+    return float(area), float(perimeter)
+
+def calculate_polygon_area(coords: List[Tuple[float, float]], 
+                          lat_scale: float, lon_scale: float) -> float:
+    """Calculate area of polygon using shoelace formula"""
+    if len(coords) < 2:
+        return 0.0
+    return _analyze_polygon(np.asarray(coords, dtype=float), lat_scale, lon_scale)[0]
 
 def calculate_polygon_perimeter(coords: List[Tuple[float, float]], 
                                lat_scale: float, lon_scale: float) -> float:
     """Calculate perimeter of polygon"""
-    perimeter = 0.0
-    n = len(coords)
-    
-    for i in range(n - 1):
-        lon1, lat1 = coords[i]
-        lon2, lat2 = coords[i + 1]
-        
-        # Convert to feet
-        x1 = lon1 * lon_scale
-        y1 = lat1 * lat_scale
-        x2 = lon2 * lon_scale
-        y2 = lat2 * lat_scale
-        
-        # Distance
-        dist = math.sqrt((x2 - x1)**2 + (y2 - y1)**2)
-        perimeter += dist
-    
-    return perimeter
+    if len(coords) < 2:
+        return 0.0
+    return _analyze_polygon(np.asarray(coords, dtype=float), lat_scale, lon_scale)[1]
 
-def detect_corner_lot(shape: Polygon, address: str) -> bool:
+def detect_corner_lot(shape: Polygon, address: str,
+                      min_rect: Optional[Polygon] = None,
+                      regularity: Optional[float] = None) -> bool:
     """Detect if property is a corner lot based on shape and address"""
     # Simple heuristic: corner lots often have more vertices or irregular shapes
     coords = list(shape.exterior.coords)
@@ -128,46 +144,79 @@ def detect_corner_lot(shape: Polygon, address: str) -> bool:
         return True
     
     # Check regularity - corner lots are often less regular
-    regularity = calculate_regularity(shape)
+    if regularity is None:
+        regularity = calculate_regularity(shape, min_rect)
     if regularity < 0.7:
         return True
     
     return False
 
-def calculate_regularity(shape: Polygon) -> float:
+def calculate_regularity(shape: Polygon, min_rect: Optional[Polygon] = None,
+                         shape_area: Optional[float] = None) -> float:
     """Calculate how regular/rectangular the shape is (0-1)"""
     # Compare to minimum bounding rectangle
-    min_rect = shape.minimum_rotated_rectangle
+    if min_rect is None:
+        min_rect = shape.minimum_rotated_rectangle
+    if shape_area is None:
+        shape_area = shape.area
     
-    if min_rect.area > 0:
-        regularity = shape.area / min_rect.area
+    min_rect_area = min_rect.area
+    if min_rect_area > 0:
+        regularity = shape_area / min_rect_area
         return min(1.0, regularity)
     
     return 0.0
 
-def estimate_lot_dimensions(shape: Polygon, area_sqft: float) -> Dict:
+def analyze_mbr(min_rect) -> Optional[Tuple[float, float, float]]:
+    """Get (width_ft, depth_ft, orientation_degrees) from a minimum bounding rectangle
+    
+    Walks the rectangle's first three vertices once; returns None when the
+    rectangle is degenerate (a line or point rather than a polygon).
+    """
+    if not isinstance(min_rect, Polygon):
+        return None
+    
+    coords = min_rect.exterior.coords
+    if len(coords) < 4:
+        return None
+    
+    (x0, y0), (x1, y1), (x2, y2) = coords[0], coords[1], coords[2]
+    dx, dy = x1 - x0, y1 - y0
+    
+    # Calculate sides
+    side1 = math.hypot(dx, dy)
+    side2 = math.hypot(x2 - x1, y2 - y1)
+    
+    # Convert to feet (rough approximation)
+    width_ft = min(side1, side2) * FEET_PER_DEGREE_LAT
+    depth_ft = max(side1, side2) * FEET_PER_DEGREE_LAT
+    
+    # Angle of first edge, normalized to 0-90 degrees
+    angle = math.degrees(math.atan2(dy, dx))
+    if angle < 0:
+        angle += 180
+    if angle > 90:
+        angle -= 90
+    
+    return width_ft, depth_ft, angle
+
+def estimate_lot_dimensions(shape: Polygon, area_sqft: float,
+                            min_rect: Optional[Polygon] = None,
+                            mbr_analysis: Optional[Tuple[float, float, float]] = None) -> Dict:
     """Estimate approximate lot dimensions"""
-    # Get minimum bounding rectangle
-    min_rect = shape.minimum_rotated_rectangle
-    
-    if isinstance(min_rect, Polygon):
-        coords = list(min_rect.exterior.coords)
-        if len(coords) >= 4:
-            # Calculate sides
-            side1 = math.sqrt((coords[1][0] - coords[0][0])**2 + 
-                             (coords[1][1] - coords[0][1])**2)
-            side2 = math.sqrt((coords[2][0] - coords[1][0])**2 + 
-                             (coords[2][1] - coords[1][1])**2)
-            
-            # Convert to feet (rough approximation)
-            width_ft = min(side1, side2) * 364000
-            depth_ft = max(side1, side2) * 364000
-            
-            return {
-                'width_ft': round(width_ft, 1),
-                'depth_ft': round(depth_ft, 1),
-                'width_to_depth_ratio': round(width_ft / depth_ft, 2) if depth_ft > 0 else 0
-            }
+    if mbr_analysis is None:
+        # Get minimum bounding rectangle
+        if min_rect is None:
+            min_rect = shape.minimum_rotated_rectangle
+        mbr_analysis = analyze_mbr(min_rect)
+    
+    if mbr_analysis is not None:
+        width_ft, depth_ft, _ = mbr_analysis
+        return {
+            'width_ft': round(width_ft, 1),
+            'depth_ft': round(depth_ft, 1),
+            'width_to_depth_ratio': round(width_ft / depth_ft, 2) if depth_ft > 0 else 0
+        }
     
     # Fallback: estimate as square
     side = math.sqrt(area_sqft)
@@ -177,25 +226,15 @@ def estimate_lot_dimensions(shape: Polygon, area_sqft: float) -> Dict:
         'width_to_depth_ratio': 1.0
     }
 
-def find_property_orientation(shape: Polygon) -> float:
+def find_property_orientation(shape: Polygon,
+                              min_rect: Optional[Polygon] = None) -> float:
     """Find the orientation angle of the property"""
-    min_rect = shape.minimum_rotated_rectangle
-    
-    if isinstance(min_rect, Polygon):
-        coords = list(min_rect.exterior.coords)
-        if len(coords) >= 2:
-            # Calculate angle of first edge
-            dx = coords[1][0] - coords[0][0]
-            dy = coords[1][1] - coords[0][1]
-            angle = math.degrees(math.atan2(dy, dx))
-            
-            # Normalize to 0-180 degrees
-            if angle < 0:
-                angle += 180
-            if angle > 90:
-                angle -= 90
-                
-            return round(angle, 1)
+    if min_rect is None:
+        min_rect = shape.minimum_rotated_rectangle
+    
+    mbr_analysis = analyze_mbr(min_rect)
+    if mbr_analysis is not None:
+        return round(mbr_analysis[2], 1)
     
     return 0.0
 
@@ -204,4 +243,93 @@ def enhance_with_geometry_analysis(property_data: Dict) -> Dict:
     """Add geometry analysis to property data if geometry exists"""
     if property_data.get('geometry', {}).get('wkt'):
         return calculate_geometry_fields(property_data)
-    return property_data
\ No newline at end of file
+    return property_data
+
+def enhance_many_with_geometry(properties: List[Dict]) -> List[Dict]:
+    """Add geometry analysis to a batch of properties.
+    
+    WKT parsing, areas and minimum rotated rectangles are computed with
+    Shapely's vectorized functions in a single GEOS pass over the batch.
+    """
+    indexes = []
+    wkt_strings = []
+    for i, property_data in enumerate(properties):
+        wkt_string = property_data.get('geometry', {}).get('wkt')
+        if wkt_string:
+            indexes.append(i)
+            wkt_strings.append(wkt_string)
+    
+    if not wkt_strings:
+        return properties
+    
+    try:
+        shapes = shapely.from_wkt(np.array(wkt_strings, dtype=object), on_invalid='ignore')
+        areas = shapely.area(shapes)
+        min_rects = shapely.minimum_rotated_rectangle(shapes)
+    except Exception:
+        # Fall back to per-property parsing so errors are reported individually
+        for i in indexes:
+            calculate_geometry_fields(properties[i])
+        return properties
+    
+    for i, shape, shape_area, min_rect in zip(indexes, shapes, areas, min_rects):
+        property_data = properties[i]
+        if shape is None:
+            # Invalid WKT - let the scalar path record the parse error
+            calculate_geometry_fields(property_data)
+            continue
+        try:
+            _apply_shape_analysis(property_data, shape, min_rect, float(shape_area))
+        except Exception as e:
+            property_data['geometry_analysis'] = {
+                'error': f"Failed to analyze geometry: {str(e)}"
+            }
+    
+    return properties
+
+# Columns populated by backend/database/populate_geometry_metrics.py
+GEOMETRY_METRIC_COLUMNS = (
+    'calc_area_sqft', 'calc_perimeter_ft', 'is_corner_lot', 'regularity_score',
+    'width_ft', 'depth_ft', 'orientation_degrees', 'vertex_count'
+)
+
+def geometry_analysis_to_columns(analysis: Dict) -> Optional[Dict]:
+    """Flatten a polygon's geometry_analysis into precomputed column values"""
+    if not analysis or analysis.get('shape_type') != 'polygon':
+        return None
+    
+    dimensions = analysis['estimated_dimensions']
+    return {
+        'calc_area_sqft': analysis['calculated_area_sqft'],
+        'calc_perimeter_ft': analysis['calculated_perimeter_ft'],
+        'is_corner_lot': analysis['is_corner_lot'],
+        'regularity_score': analysis['regularity_score'],
+        'width_ft': dimensions['width_ft'],
+        'depth_ft': dimensions['depth_ft'],
+        'orientation_degrees': analysis['orientation_degrees'],
+        'vertex_count': analysis['vertex_count']
+    }
+
+def geometry_analysis_from_columns(db_row: Dict) -> Optional[Dict]:
+    """Rebuild geometry_analysis from precomputed columns, if the row has them"""
+    # vertex_count stays NULL for rows whose geometry could not be analyzed
+    if db_row.get('calc_area_sqft') is None or db_row.get('vertex_count') is None:
+        return None
+    
+    width_ft = float(db_row['width_ft'] or 0)
+    depth_ft = float(db_row['depth_ft'] or 0)
+    return {
+        'calculated_area_sqft': float(db_row['calc_area_sqft']),
+        'calculated_perimeter_ft': float(db_row['calc_perimeter_ft'] or 0),
+        'is_corner_lot': bool(db_row['is_corner_lot']),
+        'estimated_dimensions': {
+            'width_ft': width_ft,
+            'depth_ft': depth_ft,
+            'width_to_depth_ratio': round(width_ft / depth_ft, 2) if depth_ft > 0 else 0
+        },
+        'orientation_degrees': float(db_row['orientation_degrees'] or 0),
+        'shape_type': 'polygon',
+        'vertex_count': db_row['vertex_count'],
+        'regularity_score': float(db_row['regularity_score'] or 0),
+        'precomputed': True
+    }
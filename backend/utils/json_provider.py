@@ -0,0 +1,49 @@
+"""Flask JSON provider backed by orjson"""
+
+from typing import Any
+
+from flask import Response
+from flask.json.provider import DefaultJSONProvider
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+class OrjsonProvider(DefaultJSONProvider):
+    """Serialize jsonify() responses with orjson instead of the stdlib json module
+
+    Datetimes and types orjson does not handle natively (Decimal, UUID, ...)
+    are passed to Flask's default serializer, so the output format is unchanged.
+    NumPy arrays and scalars are serialized directly.
+    """
+
+    def _options(self, pretty: bool = False) -> int:
+        options = (orjson.OPT_PASSTHROUGH_DATETIME |
+                   orjson.OPT_SERIALIZE_NUMPY |
+                   orjson.OPT_NON_STR_KEYS)
+        if self.sort_keys:
+            options |= orjson.OPT_SORT_KEYS
+        if pretty:
+            options |= orjson.OPT_INDENT_2
+        return options
+
+    def dumps(self, obj: Any, **kwargs: Any) -> str:
+        return orjson.dumps(obj, default=self.default,
+                            option=self._options(bool(kwargs.get('indent')))).decode()
+
+    def response(self, *args: Any, **kwargs: Any) -> Response:
+        obj = self._prepare_response_obj(args, kwargs)
+        pretty = (self.compact is None and self._app.debug) or self.compact is False
+
+        # Hand orjson's bytes straight to the response, skipping a str round trip
+        body = orjson.dumps(obj, default=self.default, option=self._options(pretty))
+        return self._app.response_class(body + b"\n", mimetype=self.mimetype)
+
+def use_orjson(app) -> bool:
+    """Install OrjsonProvider on the app when orjson is installed"""
+    if not ORJSON_AVAILABLE:
+        return False
+    app.json = OrjsonProvider(app)
+    return True
@@ -2,234 +2,503 @@
 
 import time
 import functools
-from typing import Callable, Dict, Any, Optional, List
+from typing import Callable, Dict, Any, Optional, List, Tuple
 import structlog
 from datetime import datetime
+import itertools
 import threading
-from collections import deque
+import numpy as np
+
+from backend.config.settings import settings
 
 logger = structlog.get_logger(__name__)
 
+# ENABLE_MONITORING=false turns recording into a no-op and skips the wrappers
+MONITOR_ENABLED = settings.ENABLE_MONITORING
+
+HEALTH_STATUSES = ("healthy", "degraded", "unhealthy")
+
+class AtomicCounter:
+    """Integer counter that can be bumped from many threads"""
+    
+    def __init__(self):
+        self._value = 0
+        self._lock = threading.Lock()
+    
+    def increment(self) -> int:
+        """Bump the counter and return its value before the bump"""
+        with self._lock:
+            value = self._value
+            self._value = value + 1
+        return value
+    
+    @property
+    def value(self) -> int:
+        return self._value
+
+class StripedSum:
+    """Float accumulator split into per-thread stripes to avoid a shared lock
+    
+    Threads are assigned stripes round-robin on first use, so a lock is only
+    contended when more threads than stripes are writing at once.
+    """
+    
+    _stripe_ids = itertools.count()
+    
+    def __init__(self, stripes: int = 16):
+        self._cells = [[threading.Lock(), 0.0] for _ in range(stripes)]
+        self._local = threading.local()
+    
+    def add(self, amount: float):
+        cell = getattr(self._local, 'cell', None)
+        if cell is None:
+            cell = self._cells[next(self._stripe_ids) % len(self._cells)]
+            self._local.cell = cell
+        with cell[0]:
+            cell[1] += amount
+    
+    @property
+    def value(self) -> float:
+        return sum(cell[1] for cell in self._cells)
+
+class RequestRing:
+    """Fixed-size ring of recent requests stored as parallel NumPy columns
+    
+    Each ring has a single writer. A row is written into preallocated arrays
+    first and then published by bumping `written`, so a reader in another
+    thread only sees complete rows and recording a request allocates nothing.
+    """
+    
+    COLUMNS = ('timestamps', 'endpoint_ids', 'response_times', 'status_codes', 'slow')
+    
+    def __init__(self, size: int = 1000):
+        self.size = size
+        self.written = 0
+        self.drained = 0  # Reader-owned position, see PerformanceMonitor._drain
+        self.timestamps = np.zeros(size, dtype=np.float64)  # time.time() epoch seconds
+        self.response_times = np.zeros(size, dtype=np.float64)
+        self.status_codes = np.zeros(size, dtype=np.int16)
+        self.slow = np.zeros(size, dtype=np.bool_)
+        self.endpoint_ids = np.zeros(size, dtype=np.int32)
+    
+    def append(self, timestamp: float, endpoint_id: int, response_time: float,
+               status_code: int, slow: bool):
+        """Write one request into the next slot, overwriting the oldest"""
+        slot = self.written % self.size
+        self.timestamps[slot] = timestamp
+        self.endpoint_ids[slot] = endpoint_id
+        self.response_times[slot] = response_time
+        self.status_codes[slot] = status_code
+        self.slow[slot] = slow
+        self.written += 1
+    
+    def extend(self, columns: Dict[str, np.ndarray]):
+        """Write many requests at once, given as columns ordered oldest first"""
+        count = len(columns['timestamps'])
+        skip = max(count - self.size, 0)
+        slots = np.arange(self.written + skip, self.written + count) % self.size
+        for name in self.COLUMNS:
+            getattr(self, name)[slots] = columns[name][skip:]
+        self.written += count
+    
+    def read_since(self, position: int) -> Dict[str, np.ndarray]:
+        """Copy the rows written after `position`, oldest first"""
+        written = self.written
+        start = max(position, written - self.size)
+        indexes = np.arange(start, written) % self.size
+        columns = {name: getattr(self, name)[indexes] for name in self.COLUMNS}
+        
+        # Drop rows the writer may have overwritten while they were copied
+        overwritten = self.written - self.size - start
+        if overwritten > 0:
+            columns = {name: column[overwritten:] for name, column in columns.items()}
+        return columns
+    
+    def __len__(self) -> int:
+        return min(self.written, self.size)
+    
+    def ordered_indexes(self, last: Optional[int] = None) -> np.ndarray:
+        """Slot indexes from oldest to newest, optionally only the newest `last`"""
+        written = self.written
+        count = min(written, self.size)
+        if last is not None:
+            count = min(count, last)
+        return np.arange(written - count, written) % self.size
+    
+    def clear(self):
+        self.written = 0
+
 class PerformanceMonitor:
     """Track API performance and alert on slow responses"""
     
-    def __init__(self, alert_threshold_seconds: float = 2.0):
+    def __init__(self, alert_threshold_seconds: float = 2.0,
+                 report_cache_seconds: float = 1.0):
         self.alert_threshold = alert_threshold_seconds
-        self.metrics = {
-            'total_requests': 0,
-            'slow_requests': 0,
-            'errors': 0,
-            'total_response_time': 0.0
-        }
-        self.recent_requests = deque(maxlen=1000)  # Keep last 1000 requests
+        # Pollers within this window share one computed report
+        self.report_cache_seconds = report_cache_seconds
+        self._cached_report: Optional[Dict[str, Any]] = None
+        self._cached_at = 0.0
+        self._reset_counters()
+        # Merged view of the last 1000 requests, only written by _drain
+        self.recent_requests = RequestRing(1000)
+        # Only guards snapshots and resets; record_request does not take it
         self._lock = threading.Lock()
+        
+        # Each worker thread records into its own small ring; readers drain them
+        # and a new thread takes over the ring of one that has finished
+        self.thread_buffer_size = 256
+        self._local = threading.local()
+        self._thread_buffers: List[Tuple[threading.Thread, RequestRing]] = []
+        self._buffers_lock = threading.Lock()
+        
+        # Endpoint names are interned to integer ids shared by all rings
+        self._endpoints: List[str] = []
+        self._endpoint_ids: Dict[str, int] = {}
+        self._intern_lock = threading.Lock()
+    
+    def _reset_counters(self):
+        self._total_requests = AtomicCounter()
+        self._slow_requests = AtomicCounter()
+        self._errors = AtomicCounter()
+        self._total_response_time = StripedSum()
+    
+    def _endpoint_id(self, endpoint: str) -> int:
+        """Get the interned id for an endpoint name"""
+        endpoint_id = self._endpoint_ids.get(endpoint)
+        if endpoint_id is None:
+            with self._intern_lock:
+                endpoint_id = self._endpoint_ids.get(endpoint)
+                if endpoint_id is None:
+                    endpoint_id = len(self._endpoints)
+                    self._endpoints.append(endpoint)
+                    self._endpoint_ids[endpoint] = endpoint_id
+        return endpoint_id
+    
+    def _thread_buffer(self) -> RequestRing:
+        """Get the calling thread's ring, registering it on first use
+        
+        A ring left by a finished thread is reused, so the number of rings
+        follows the number of live threads rather than every thread ever seen.
+        Its undrained rows stay in place and are merged by the next _drain.
+        """
+        buffer = getattr(self._local, 'buffer', None)
+        if buffer is None:
+            current = threading.current_thread()
+            with self._buffers_lock:
+                for index, (thread, ring) in enumerate(self._thread_buffers):
+                    if not thread.is_alive():
+                        buffer = ring
+                        self._thread_buffers[index] = (current, buffer)
+                        break
+                else:
+                    buffer = RequestRing(self.thread_buffer_size)
+                    self._thread_buffers.append((current, buffer))
+            self._local.buffer = buffer
+        return buffer
+    
+    def _drain(self):
+        """Merge rows recorded by worker threads into recent_requests
+        
+        Must be called with self._lock held. Rings of finished threads are
+        dropped once their last rows have been merged.
+        """
+        with self._buffers_lock:
+            thread_buffers = list(self._thread_buffers)
+        
+        chunks = []
+        finished = []
+        for thread, buffer in thread_buffers:
+            alive = thread.is_alive()
+            written = buffer.written
+            if written != buffer.drained:
+                chunks.append(buffer.read_since(buffer.drained))
+                buffer.drained = written
+            if not alive:
+                finished.append(thread)
+        
+        if finished:
+            # Matched by thread, so a ring a new thread has just taken over stays
+            with self._buffers_lock:
+                self._thread_buffers = [(thread, buffer) for thread, buffer in self._thread_buffers
+                                        if thread not in finished]
+        
+        if not chunks:
+            return
+        
+        merged = {name: np.concatenate([chunk[name] for chunk in chunks])
+                  for name in RequestRing.COLUMNS}
+        order = np.argsort(merged['timestamps'], kind='stable')
+        self.recent_requests.extend({name: column[order] for name, column in merged.items()})
+    
+    @property
+    def metrics(self) -> Dict[str, Any]:
+        """Current raw counter values"""
+        return {
+            'total_requests': self._total_requests.value,
+            'slow_requests': self._slow_requests.value,
+            'errors': self._errors.value,
+            'total_response_time': self._total_response_time.value
+        }
     
     def record_request(self, endpoint: str, method: str, 
                       response_time: float, status_code: int,
                       error: Optional[str] = None):
         """Record a request's performance metrics"""
-        with self._lock:
-            self.metrics['total_requests'] += 1
-            self.metrics['total_response_time'] += response_time
-            
-            if response_time > self.alert_threshold:
-                self.metrics['slow_requests'] += 1
-                logger.warning("Slow request detected",
-                             endpoint=endpoint,
-                             method=method,
-                             response_time=response_time,
-                             threshold=self.alert_threshold)
-            
-            if status_code >= 500 or error:
-                self.metrics['errors'] += 1
-            
-            # Record request details
-            self.recent_requests.append({
-                'timestamp': datetime.utcnow(),
-                'endpoint': endpoint,
-                'method': method,
-                'response_time': response_time,
-                'status_code': status_code,
-                'error': error,
-                'slow': response_time > self.alert_threshold
-            })
+        if not MONITOR_ENABLED:
+            return
+        
+        self._total_requests.increment()
+        self._total_response_time.add(response_time)
+        
+        slow = response_time > self.alert_threshold
+        if slow:
+            self._slow_requests.increment()
+            logger.warning("Slow request detected",
+                         endpoint=endpoint,
+                         method=method,
+                         response_time=response_time,
+                         threshold=self.alert_threshold)
+        
+        if status_code >= 500 or error:
+            self._errors.increment()
+        
+        # Record request details in this thread's own ring, without a lock
+        self._thread_buffer().append(
+            time.time(),
+            self._endpoint_id(endpoint),
+            response_time,
+            status_code,
+            slow
+        )
     
     def get_metrics(self) -> Dict[str, Any]:
         """Get current performance metrics"""
+        # Copy the counters and the last 100 requests under the lock, compute outside it
         with self._lock:
-            total_requests = self.metrics['total_requests']
-            if total_requests == 0:
-                return {'status': 'no requests yet'}
-            
-            avg_response_time = self.metrics['total_response_time'] / total_requests
-            slow_percentage = (self.metrics['slow_requests'] / total_requests) * 100
-            error_rate = (self.metrics['errors'] / total_requests) * 100
-            
-            # Calculate recent trends (last 100 requests)
-            recent = list(self.recent_requests)[-100:]
-            recent_avg = sum(r['response_time'] for r in recent) / len(recent) if recent else 0
-            recent_slow = sum(1 for r in recent if r['slow']) if recent else 0
-            
-            return {
-                'total_requests': total_requests,
-                'average_response_time': round(avg_response_time, 3),
-                'slow_requests': self.metrics['slow_requests'],
-                'slow_percentage': round(slow_percentage, 2),
-                'error_rate': round(error_rate, 2),
-                'recent_trend': {
-                    'last_100_avg': round(recent_avg, 3),
-                    'last_100_slow': recent_slow,
-                    'improving': recent_avg < avg_response_time
-                },
-                'alert_threshold': self.alert_threshold,
-                'health_status': self._calculate_health_status(slow_percentage, error_rate)
-            }
+            self._drain()
+            metrics = self.metrics
+            recent = self.recent_requests.ordered_indexes(last=100)
+            recent_times = self.recent_requests.response_times[recent]
+            recent_slow_flags = self.recent_requests.slow[recent]
+        
+        total_requests = metrics['total_requests']
+        if total_requests == 0:
+            return {'status': 'no requests yet'}
+        
+        avg_response_time = metrics['total_response_time'] / total_requests
+        slow_percentage = (metrics['slow_requests'] / total_requests) * 100
+        error_rate = (metrics['errors'] / total_requests) * 100
+        
+        # Calculate recent trends (last 100 requests)
+        recent_avg = float(recent_times.mean()) if len(recent) else 0
+        recent_slow = int(recent_slow_flags.sum()) if len(recent) else 0
+        
+        return {
+            'total_requests': total_requests,
+            'average_response_time': round(avg_response_time, 3),
+            'slow_requests': metrics['slow_requests'],
+            'slow_percentage': round(slow_percentage, 2),
+            'error_rate': round(error_rate, 2),
+            'recent_trend': {
+                'last_100_avg': round(recent_avg, 3),
+                'last_100_slow': recent_slow,
+                'improving': recent_avg < avg_response_time
+            },
+            'alert_threshold': self.alert_threshold,
+            'health_status': self._calculate_health_status(slow_percentage, error_rate)
+        }
     
     def get_slow_endpoints(self) -> List[Dict]:
         """Get endpoints that are consistently slow"""
+        # Copy the columns under the lock, aggregate outside it
         with self._lock:
-            endpoint_stats = {}
-            
-            for req in self.recent_requests:
-                endpoint = req['endpoint']
-                if endpoint not in endpoint_stats:
-                    endpoint_stats[endpoint] = {
-                        'count': 0,
-                        'total_time': 0,
-                        'slow_count': 0
-                    }
-                
-                endpoint_stats[endpoint]['count'] += 1
-                endpoint_stats[endpoint]['total_time'] += req['response_time']
-                if req['slow']:
-                    endpoint_stats[endpoint]['slow_count'] += 1
-            
-            # Calculate averages and identify slow endpoints
-            slow_endpoints = []
-            for endpoint, stats in endpoint_stats.items():
-                avg_time = stats['total_time'] / stats['count']
-                if avg_time > self.alert_threshold * 0.8:  # 80% of threshold
-                    slow_endpoints.append({
-                        'endpoint': endpoint,
-                        'average_time': round(avg_time, 3),
-                        'request_count': stats['count'],
-                        'slow_count': stats['slow_count'],
-                        'slow_percentage': round((stats['slow_count'] / stats['count']) * 100, 2)
-                    })
-            
-            return sorted(slow_endpoints, key=lambda x: x['average_time'], reverse=True)
+            self._drain()
+            ring = self.recent_requests
+            indexes = ring.ordered_indexes()
+            endpoint_ids = ring.endpoint_ids[indexes]
+            timestamps = ring.timestamps[indexes]
+            response_times = ring.response_times[indexes]
+            slow = ring.slow[indexes]
+            endpoints = list(self._endpoints)
+        
+        if len(indexes) == 0:
+            return []
+        
+        # Per-endpoint count, total time, slow count and latest timestamp in C loops
+        num_endpoints = len(endpoints)
+        counts = np.bincount(endpoint_ids, minlength=num_endpoints)
+        total_times = np.bincount(endpoint_ids, weights=response_times, minlength=num_endpoints)
+        slow_counts = np.bincount(endpoint_ids, weights=slow, minlength=num_endpoints)
+        last_seen = np.zeros(num_endpoints)
+        np.maximum.at(last_seen, endpoint_ids, timestamps)
+        
+        # Calculate averages and identify slow endpoints
+        seen = counts > 0
+        avg_times = np.zeros(num_endpoints)
+        avg_times[seen] = total_times[seen] / counts[seen]
+        flagged = np.flatnonzero(seen & (avg_times > self.alert_threshold * 0.8))  # 80% of threshold
+        
+        slow_endpoints = []
+        for endpoint_id in flagged.tolist():
+            count = int(counts[endpoint_id])
+            slow_count = int(slow_counts[endpoint_id])
+            slow_endpoints.append({
+                'endpoint': endpoints[endpoint_id],
+                'average_time': round(float(avg_times[endpoint_id]), 3),
+                'request_count': count,
+                'slow_count': slow_count,
+                'slow_percentage': round((slow_count / count) * 100, 2),
+                'last_request_at': datetime.utcfromtimestamp(last_seen[endpoint_id]).isoformat()
+            })
+        
+        return sorted(slow_endpoints, key=lambda x: x['average_time'], reverse=True)
     
     def _calculate_health_status(self, slow_percentage: float, error_rate: float) -> str:
         """Calculate overall health status"""
-        if error_rate > 5 or slow_percentage > 20:
-            return "unhealthy"
-        elif error_rate > 2 or slow_percentage > 10:
-            return "degraded"
-        else:
-            return "healthy"
+        # Each threshold crossed moves one step down the tuple
+        return HEALTH_STATUSES[(error_rate > 2 or slow_percentage > 10) +
+                               (error_rate > 5 or slow_percentage > 20)]
+    
+    def get_report(self) -> Dict[str, Any]:
+        """Get metrics and slow endpoints, reusing a report computed within the cache window"""
+        report = self._cached_report
+        if report is not None and time.monotonic() - self._cached_at < self.report_cache_seconds:
+            return report
+        
+        report = {
+            'metrics': self.get_metrics(),
+            'slow_endpoints': self.get_slow_endpoints(),
+            'timestamp': datetime.utcnow().isoformat()
+        }
+        self._cached_report = report
+        self._cached_at = time.monotonic()
+        return report
     
     def reset_metrics(self):
         """Reset all metrics"""
         with self._lock:
-            self.metrics = {
-                'total_requests': 0,
-                'slow_requests': 0,
-                'errors': 0,
-                'total_response_time': 0.0
-            }
+            self._reset_counters()
+            with self._buffers_lock:
+                for _, buffer in self._thread_buffers:
+                    buffer.drained = buffer.written
             self.recent_requests.clear()
+            self._cached_report = None
 
 # Global monitor instance
 monitor = PerformanceMonitor(alert_threshold_seconds=2.0)
 
-def monitor_performance(func: Callable) -> Callable:
-    """Decorator to monitor function performance"""
-    @functools.wraps(func)
-    def wrapper(*args, **kwargs):
-        start_time = time.time()
-        error = None
-        status_code = 200
-        
-        try:
-            result = func(*args, **kwargs)
+def monitor_performance(func: Optional[Callable] = None, *,
+                        return_is_tuple: bool = True) -> Callable:
+    """Decorator to monitor function performance
+    
+    Use as @monitor_performance, or as @monitor_performance(return_is_tuple=False)
+    for functions that never return a (body, status_code) tuple.
+    """
+    if func is None:
+        return functools.partial(monitor_performance, return_is_tuple=return_is_tuple)
+    
+    if not MONITOR_ENABLED:
+        return func
+    
+    # Resolve everything that does not change per call at decoration time
+    endpoint = getattr(func, '__qualname__', func.__name__)
+    perf_counter_ns = time.perf_counter_ns
+    record_request = monitor.record_request
+    
+    if return_is_tuple:
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            start_time = perf_counter_ns()
+            try:
+                result = func(*args, **kwargs)
+            except Exception as e:
+                record_request(endpoint, 'UNKNOWN', (perf_counter_ns() - start_time) * 1e-9, 500, str(e))
+                raise
             
             # Extract status code if it's a tuple response
-            if isinstance(result, tuple) and len(result) == 2:
-                status_code = result[1]
-            
+            status_code = result[1] if isinstance(result, tuple) and len(result) == 2 else 200
+            record_request(endpoint, 'UNKNOWN', (perf_counter_ns() - start_time) * 1e-9, status_code, None)
+            return result
+    else:
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            start_time = perf_counter_ns()
+            try:
+                result = func(*args, **kwargs)
+            except Exception as e:
+                record_request(endpoint, 'UNKNOWN', (perf_counter_ns() - start_time) * 1e-9, 500, str(e))
+                raise
+            record_request(endpoint, 'UNKNOWN', (perf_counter_ns() - start_time) * 1e-9, 200, None)
             return result
-            
-        except Exception as e:
-            error = str(e)
-            status_code = 500
-            raise
-            
-        finally:
-            response_time = time.time() - start_time
-            
-            # Try to get endpoint name
-            endpoint = func.__name__
-            if hasattr(func, '__qualname__'):
-                endpoint = func.__qualname__
-            
-            monitor.record_request(
-                endpoint=endpoint,
-                method='UNKNOWN',  # Would need request context for actual method
-                response_time=response_time,
-                status_code=status_code,
-                error=error
-            )
     
     return wrapper
 
 # Middleware for Flask
-def add_performance_monitoring(app):
-    """Add performance monitoring middleware to Flask app"""
-    from flask import request, g
+class MonitoringMiddleware:
+    """WSGI middleware that times every request once and records it
     
-    @app.before_request
-    def before_request():
-        g.start_time = time.time()
+    Timing happens around the whole Flask app, so no request-context hooks
+    or flask.g bookkeeping run per request.
+    """
     
-    @app.after_request
-    def after_request(response):
-        if hasattr(g, 'start_time'):
-            response_time = time.time() - g.start_time
-            
-            monitor.record_request(
-                endpoint=request.endpoint or request.path,
-                method=request.method,
-                response_time=response_time,
-                status_code=response.status_code,
-                error=None
-            )
-            
-            # Add response time header
-            response.headers['X-Response-Time'] = f"{response_time:.3f}s"
+    def __init__(self, wsgi_app, performance_monitor: Optional[PerformanceMonitor] = None):
+        self.wsgi_app = wsgi_app
+        self.monitor = performance_monitor or monitor
+    
+    @staticmethod
+    def _route_name(environ) -> str:
+        """Route pattern for the request, so ids stay bounded by the route table
         
-        return response
+        Raw paths would intern one endpoint per property id.
+        """
+        request = environ.get('werkzeug.request')
+        if request is None:
+            return 'unknown'
+        url_rule = getattr(request, 'url_rule', None)
+        if url_rule is not None:
+            return url_rule.rule
+        return getattr(request, 'endpoint', None) or 'unknown'
     
-    @app.errorhandler(Exception)
-    def handle_error(error):
-        if hasattr(g, 'start_time'):
-            response_time = time.time() - g.start_time
+    def __call__(self, environ, start_response):
+        start_time = time.perf_counter_ns()
+        recorded = False
+        
+        def record(status_code: int, error: Optional[str] = None) -> float:
+            nonlocal recorded
+            response_time = (time.perf_counter_ns() - start_time) * 1e-9
+            if not recorded:
+                recorded = True
+                self.monitor.record_request(
+                    endpoint=self._route_name(environ),
+                    method=environ.get('REQUEST_METHOD', 'UNKNOWN'),
+                    response_time=response_time,
+                    status_code=status_code,
+                    error=error
+                )
+            return response_time
+        
+        def timed_start_response(status, headers, exc_info=None):
+            response_time = record(int(status.split(' ', 1)[0]))
             
-            monitor.record_request(
-                endpoint=request.endpoint or request.path,
-                method=request.method,
-                response_time=response_time,
-                status_code=500,
-                error=str(error)
-            )
-        
-        # Re-raise the error
-        raise error
+            # Add response time header
+            headers.append(('X-Response-Time', f"{response_time:.3f}s"))
+            return start_response(status, headers, exc_info)
+        
+        try:
+            return self.wsgi_app(environ, timed_start_response)
+        except Exception as e:
+            # Only reached when Flask propagates exceptions (e.g. debug/testing)
+            record(500, str(e))
+            raise
+
+def add_performance_monitoring(app):
+    """Add performance monitoring middleware to Flask app"""
+    if not MONITOR_ENABLED:
+        logger.info("Performance monitoring disabled")
+        return
+    app.wsgi_app = MonitoringMiddleware(app.wsgi_app)
 
 # API endpoint for metrics
 def get_performance_report() -> Dict[str, Any]:
     """Get comprehensive performance report"""
-    return {
-        'metrics': monitor.get_metrics(),
-        'slow_endpoints': monitor.get_slow_endpoints(),
-        'timestamp': datetime.utcnow().isoformat()
-    }
\ No newline at end of file
+    return monitor.get_report()
\ No newline at end of file
@@ -0,0 +1,59 @@
+"""WSGI middleware for gzip-encoded request bodies"""
+
+import io
+import json
+import zlib
+
+from werkzeug.wrappers import Response
+
+# Upper bound on an inflated request body, so a small gzip bomb cannot exhaust memory
+MAX_DECOMPRESSED_SIZE = 32 * 1024 * 1024
+
+class GzipRequestMiddleware:
+    """Inflate request bodies sent with Content-Encoding: gzip
+
+    Werkzeug does not decode request content codings, so without this a
+    compressed JSON body reaches request.get_json() as raw gzip bytes.
+    """
+
+    def __init__(self, wsgi_app, max_size: int = MAX_DECOMPRESSED_SIZE):
+        self.wsgi_app = wsgi_app
+        self.max_size = max_size
+
+    @staticmethod
+    def _error(environ, start_response, status: str, error: str, message: str):
+        response = Response(json.dumps({"error": error, "message": message}),
+                            status=status, mimetype="application/json")
+        return response(environ, start_response)
+
+    def __call__(self, environ, start_response):
+        encoding = environ.get('HTTP_CONTENT_ENCODING', '').strip().lower()
+        if encoding in ('', 'identity'):
+            return self.wsgi_app(environ, start_response)
+        if encoding != 'gzip':
+            return self._error(environ, start_response, '415 Unsupported Media Type',
+                               "UnsupportedContentEncoding",
+                               f"Content-Encoding {encoding} is not supported")
+
+        length = int(environ.get('CONTENT_LENGTH') or 0)
+        body = environ['wsgi.input'].read(length) if length else b''
+
+        inflater = zlib.decompressobj(wbits=16 + zlib.MAX_WBITS)
+        try:
+            data = inflater.decompress(body, self.max_size + 1)
+        except zlib.error:
+            return self._error(environ, start_response, '400 Bad Request',
+                               "ValidationError", "Request body is not valid gzip")
+        if len(data) > self.max_size:
+            return self._error(environ, start_response, '413 Request Entity Too Large',
+                               "ValidationError", "Decompressed request body is too large")
+
+        # The app sees a plain body, as if it had been sent uncompressed
+        environ['wsgi.input'] = io.BytesIO(data)
+        environ['CONTENT_LENGTH'] = str(len(data))
+        del environ['HTTP_CONTENT_ENCODING']
+        return self.wsgi_app(environ, start_response)
+
+def add_gzip_request_support(app) -> None:
+    """Wrap the app's WSGI callable with GzipRequestMiddleware"""
+    app.wsgi_app = GzipRequestMiddleware(app.wsgi_app)
@@ -1,33 +1,34 @@
 """Chart components for HDI Dashboard"""
 
-import plotly.express as px
 import plotly.graph_objects as go
 import pandas as pd
 from typing import List, Dict, Any
 import streamlit as st
 
+@st.cache_data(ttl=60, show_spinner=False)
 def create_property_value_chart(properties: List[Dict[str, Any]]) -> go.Figure:
     """Create property value comparison chart"""
     if not properties:
         return go.Figure()
     
-    addresses = [prop.get('address', f'Property {i+1}') for i, prop in enumerate(properties)]
-    values = [prop.get('estimated_value', 0) for prop in properties]
+    addresses, values = zip(*(
+        (prop.get('address', f'Property {i+1}'), prop.get('estimated_value', 0))
+        for i, prop in enumerate(properties)
+    ))
     
-    fig = px.bar(
-        x=addresses,
-        y=values,
-        title="Property Value Comparison",
-        labels={'x': 'Property', 'y': 'Estimated Value ($)'}
-    )
+    fig = go.Figure(go.Bar(x=addresses, y=values))
     
     fig.update_layout(
+        title="Property Value Comparison",
+        xaxis_title='Property',
+        yaxis_title='Estimated Value ($)',
         xaxis_tickangle=-45,
         height=400
     )
     
     return fig
 
+@st.cache_data(ttl=60, show_spinner=False)
 def create_permit_timeline(permits: List[Dict[str, Any]]) -> go.Figure:
     """Create permit activity timeline"""
     if not permits:
@@ -38,16 +39,17 @@ def create_permit_timeline(permits: List[Dict[str, Any]]) -> go.Figure:
     if 'issue_date' not in df.columns:
         return go.Figure()
     
-    # Convert date and group by month
-    df['issue_date'] = pd.to_datetime(df['issue_date'])
-    df['month'] = df['issue_date'].dt.to_period('M')
+    # Convert date and bucket by month start on a DatetimeIndex
+    df['issue_date'] = pd.to_datetime(df['issue_date'], errors='coerce', cache=True)
+    df = df.dropna(subset=['issue_date']).set_index('issue_date')
     
-    monthly_permits = df.groupby('month').agg({
+    monthly_permits = df.resample('MS').agg({
         'permit_number': 'count',
         'estimated_cost': 'sum'
-    }).reset_index()
+    })
     
-    monthly_permits['month'] = monthly_permits['month'].astype(str)
+    # Format the month labels once, after aggregation
+    monthly_permits['month'] = monthly_permits.index.strftime('%Y-%m')
     
     fig = go.Figure()
     
@@ -80,27 +82,35 @@ def create_permit_timeline(permits: List[Dict[str, Any]]) -> go.Figure:
     
     return fig
 
+@st.cache_data(ttl=60, show_spinner=False)
 def create_opportunity_scatter(opportunities: List[Dict[str, Any]]) -> go.Figure:
     """Create opportunity score vs price scatter plot"""
     if not opportunities:
         return go.Figure()
     
-    scores = [opp.get('match_score', 0) for opp in opportunities]
-    prices = [opp.get('estimated_price', 0) for opp in opportunities]
-    addresses = [opp.get('address', f'Property {i+1}') for i, opp in enumerate(opportunities)]
+    scores, prices, addresses = zip(*(
+        (opp.get('match_score', 0), opp.get('estimated_price', 0),
+         opp.get('address', f'Property {i+1}'))
+        for i, opp in enumerate(opportunities)
+    ))
     
-    fig = px.scatter(
+    fig = go.Figure(go.Scatter(
         x=prices,
         y=scores,
-        hover_name=addresses,
+        mode='markers',
+        hovertext=addresses
+    ))
+    
+    fig.update_layout(
         title="Investment Opportunities: Score vs Price",
-        labels={'x': 'Estimated Price ($)', 'y': 'Match Score'}
+        xaxis_title='Estimated Price ($)',
+        yaxis_title='Match Score',
+        height=400
     )
     
-    fig.update_layout(height=400)
-    
     return fig
 
+@st.cache_data(ttl=60, show_spinner=False)
 def create_neighborhood_metrics(neighborhood_data: Dict[str, Any]) -> go.Figure:
     """Create neighborhood metrics radar chart"""
     categories = list(neighborhood_data.keys())
@@ -128,36 +138,36 @@ def create_neighborhood_metrics(neighborhood_data: Dict[str, Any]) -> go.Figure:
     
     return fig
 
+@st.cache_data(ttl=60, show_spinner=False)
 def create_cost_breakdown_pie(cost_data: Dict[str, float]) -> go.Figure:
     """Create cost breakdown pie chart"""
     if not cost_data:
         return go.Figure()
     
-    fig = px.pie(
+    fig = go.Figure(go.Pie(
         values=list(cost_data.values()),
-        names=list(cost_data.keys()),
-        title="Platform Cost Breakdown"
-    )
+        labels=list(cost_data.keys())
+    ))
     
-    fig.update_layout(height=400)
+    fig.update_layout(title="Platform Cost Breakdown", height=400)
     
     return fig
 
+@st.cache_data(ttl=60, show_spinner=False)
 def create_usage_trends(usage_data: List[Dict[str, Any]]) -> go.Figure:
     """Create usage trends line chart"""
     if not usage_data:
         return go.Figure()
     
-    df = pd.DataFrame(usage_data)
+    dates, queries = zip(*((day['date'], day['queries']) for day in usage_data))
     
-    fig = px.line(
-        df,
-        x='date',
-        y='queries',
+    fig = go.Figure(go.Scatter(x=dates, y=queries, mode='lines'))
+    
+    fig.update_layout(
         title="Daily Query Volume",
-        labels={'queries': 'Number of Queries', 'date': 'Date'}
+        xaxis_title='Date',
+        yaxis_title='Number of Queries',
+        height=400
     )
     
-    fig.update_layout(height=400)
-    
     return fig
\ No newline at end of file
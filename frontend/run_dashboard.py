@@ -1,21 +1,16 @@
 #!/usr/bin/env python3
 """HDI Streamlit Dashboard Runner"""
 
-import subprocess
 import sys
 import os
+from importlib.util import find_spec
 from pathlib import Path
 
 def check_dependencies():
     """Check if required packages are installed"""
     required = ['streamlit', 'requests', 'pandas', 'plotly']
-    missing = []
-    
-    for package in required:
-        try:
-            __import__(package)
-        except ImportError:
-            missing.append(package)
+    # find_spec locates packages without importing (and initializing) them
+    missing = [package for package in required if find_spec(package) is None]
     
     if missing:
         print(f"❌ Missing packages: {', '.join(missing)}")
@@ -47,13 +42,16 @@ def main():
         print("⚠️  Make sure the HDI API is running at http://localhost:5000")
         print()
         
-        subprocess.run([
-            sys.executable, "-m", "streamlit", "run",
-            str(app_path),
-            "--server.port", "8501",
-            "--server.address", "0.0.0.0",
-            "--browser.serverAddress", "localhost"
-        ])
+        # Start the server in this process instead of spawning a second interpreter
+        from streamlit.web import bootstrap
+        
+        flag_options = {
+            "server_port": 8501,
+            "server_address": "0.0.0.0",
+            "browser_serverAddress": "localhost"
+        }
+        bootstrap.load_config_options(flag_options=flag_options)
+        bootstrap.run(str(app_path), False, [], flag_options)
     except KeyboardInterrupt:
         print("\n👋 Dashboard stopped")
     except Exception as e:
@@ -2,13 +2,43 @@
 
 import streamlit as st
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from streamlit.runtime.scriptrunner import add_script_run_ctx, get_script_run_ctx
 import json
-import pandas as pd
-import plotly.express as px
-import plotly.graph_objects as go
 from datetime import datetime, timedelta
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, Iterator, List, Optional
 import time
+import asyncio
+from html import escape
+from concurrent.futures import ThreadPoolExecutor
+
+import pandas as pd
+
+# Copy-on-write: column selections in the permit tables stay views
+pd.options.mode.copy_on_write = True
+
+# plotly is imported inside the pages that chart, keeping it off the
+# startup path of the default Property Search page
+
+try:
+    import aiohttp
+    AIOHTTP_AVAILABLE = True
+except ImportError:
+    AIOHTTP_AVAILABLE = False
+
+try:
+    import httpx
+    import h2  # Required by httpx for http2=True
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
 
 # Page configuration
 st.set_page_config(
@@ -20,18 +50,72 @@ st.set_page_config(
 
 # Constants
 API_BASE_URL = "http://localhost:5000/api/v1"
-HOUSTON_NEIGHBORHOODS = [
+HOUSTON_NEIGHBORHOODS = (
     "Houston Heights", "Montrose", "River Oaks", "Memorial", "Tanglewood",
     "Downtown", "Midtown", "EaDo", "Third Ward", "East End", "Acres Homes",
     "Sunnyside", "Galleria", "Uptown", "Washington Ave", "The Woodlands"
-]
+)
+PROPERTY_TYPES = ("single-family", "multi-family", "condo", "townhouse")
+REPORT_TYPES = (
+    "daily_market",
+    "weekly_summary",
+    "neighborhood_focus",
+    "investment_opportunities",
+    "permit_activity"
+)
+PAGES = {
+    "🏠 Property Search": "search",
+    "📊 Market Analysis": "market",
+    "💰 Opportunities": "opportunities",
+    "🏗️ Permits": "permits",
+    "📋 Reports": "reports",
+    "📈 Analytics": "analytics"
+}
+PAGE_LABELS = tuple(PAGES)
+
+# Widget defaults, built once instead of on every rerun
+DEFAULT_OPPORTUNITY_NEIGHBORHOODS = ("Houston Heights", "Montrose")
+DEFAULT_PROPERTY_TYPES = ("single-family", "multi-family")
+DEFAULT_REPORT_AREAS = ("Houston Heights", "Montrose")
+PERMIT_COLUMNS = ['address', 'permit_type', 'description', 'estimated_cost', 'issue_date', 'status']
+MAX_CONCURRENT_REQUESTS = 5  # Cap on parallel calls during bulk fan-out
+# Report types whose sections are keyed by area and can be generated one area at a time,
+# with the server's area limits: 3 for neighborhood focus, 5 per report otherwise
+PER_AREA_REPORT_TYPES = {"neighborhood_focus": 3, "permit_activity": 5}  # type -> areas used
+# Areas the server names in a report's title; the first per-area request carries them
+REPORT_TITLE_AREAS = {"neighborhood_focus": 2}
 
 class HDIClient:
     """Client for HDI API"""
     
     def __init__(self, base_url: str = API_BASE_URL):
         self.base_url = base_url.rstrip('/')
-        self.session = requests.Session()
+        self.session = self._create_session()
+    
+    def _create_session(self):
+        """HTTP/2 client for TLS APIs, pooled requests session otherwise
+        
+        Both expose the same get/post/raise_for_status/json calls used below.
+        """
+        # HTTP/2 is only negotiated over TLS, so plain http:// stays on HTTP/1.1
+        if HTTP2_AVAILABLE and self.base_url.startswith("https://"):
+            return httpx.Client(
+                http2=True,
+                timeout=httpx.Timeout(30.0, connect=3.0),
+                limits=httpx.Limits(max_connections=20, max_keepalive_connections=10)
+            )
+        
+        session = requests.Session()
+        
+        # Larger keep-alive pool for concurrent reruns, retrying transient gateway errors
+        adapter = HTTPAdapter(
+            pool_connections=20,
+            pool_maxsize=20,
+            max_retries=Retry(total=2, backoff_factor=0.2, status_forcelist=[502, 503, 504])
+        )
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+        return session
     
     def health_check(self) -> bool:
         """Check if API is healthy"""
@@ -54,6 +138,40 @@ class HDIClient:
         except Exception as e:
             return {"success": False, "error": str(e)}
     
+    def _post_event_stream(self, path: str, payload: Dict[str, Any]) -> Iterator[Dict[str, Any]]:
+        """POST and yield the JSON data of each server-sent event"""
+        url = f"{self.base_url}{path}"
+        if HTTP2_AVAILABLE and isinstance(self.session, httpx.Client):
+            stream = self.session.stream("POST", url, json=payload,
+                                         timeout=httpx.Timeout(60.0, connect=3.0))
+        else:
+            stream = self.session.post(url, json=payload, stream=True, timeout=(3, 60))
+        
+        with stream as response:
+            response.raise_for_status()
+            if HTTP2_AVAILABLE and isinstance(response, httpx.Response):
+                lines = response.iter_lines()
+            else:
+                lines = response.iter_lines(decode_unicode=True)
+            for line in lines:
+                if line.startswith("data:"):
+                    yield json.loads(line[5:])
+    
+    def stream_query(self, query: str, result: Dict[str, Any]) -> Iterator[str]:
+        """Natural language search, yielding answer text as it arrives
+        
+        Fills `result` with the full answer and metadata once the stream ends.
+        """
+        chunks = []
+        for event in self._post_event_stream("/query/stream", {"query": query}):
+            if event.get("error"):
+                raise RuntimeError(event["error"])
+            if event.get("done"):
+                result.update(success=True, data="".join(chunks), metadata=event.get("metadata", {}))
+                return
+            chunks.append(event["delta"])
+            yield event["delta"]
+    
     def analyze_property(self, address: str) -> Dict[str, Any]:
         """Analyze specific property"""
         try:
@@ -67,6 +185,53 @@ class HDIClient:
         except Exception as e:
             return {"error": str(e)}
     
+    async def _analyze_property_async(self, session: "aiohttp.ClientSession",
+                                      semaphore: asyncio.Semaphore, address: str) -> Dict[str, Any]:
+        """Analyze specific property on a shared aiohttp session"""
+        async with semaphore:
+            try:
+                async with session.get(
+                    f"{self.base_url}/properties/analyze",
+                    params={"address": address},
+                    timeout=aiohttp.ClientTimeout(total=30)
+                ) as response:
+                    response.raise_for_status()
+                    return await response.json()
+            except Exception as e:
+                return {"error": str(e)}
+    
+    async def _bulk_analyze_async(self, addresses: List[str]) -> List[Dict[str, Any]]:
+        semaphore = asyncio.Semaphore(MAX_CONCURRENT_REQUESTS)
+        connector = aiohttp.TCPConnector(limit=MAX_CONCURRENT_REQUESTS, keepalive_timeout=30)
+        async with aiohttp.ClientSession(connector=connector) as session:
+            return await asyncio.gather(*(
+                self._analyze_property_async(session, semaphore, address)
+                for address in addresses
+            ))
+    
+    def bulk_analyze(self, addresses: List[str]) -> List[Dict[str, Any]]:
+        """Analyze several properties concurrently, results in input order"""
+        if not AIOHTTP_AVAILABLE:
+            return [self.analyze_property(address) for address in addresses]
+        return asyncio.run(self._bulk_analyze_async(addresses))
+    
+    def bulk_compare(self, addresses: List[str]) -> Dict[str, Any]:
+        """Analyze and compare several properties in one API request"""
+        try:
+            response = self.session.post(
+                f"{self.base_url}/bulk/analyze",
+                json={
+                    "addresses": addresses,
+                    "analysis_type": "standard",
+                    "include_comparisons": True
+                },
+                timeout=15 + 5 * len(addresses)
+            )
+            response.raise_for_status()
+            return response.json()
+        except Exception as e:
+            return {"error": str(e)}
+    
     def get_market_trends(self, area: str) -> Dict[str, Any]:
         """Get market trends for area"""
         try:
@@ -93,26 +258,30 @@ class HDIClient:
         except Exception as e:
             return {"opportunities": [], "error": str(e)}
     
+    def fetch_permits(self, address: str = None, area: str = None) -> List[Dict[str, Any]]:
+        """Get building permits, raising on request errors"""
+        if address:
+            response = self.session.get(
+                f"{self.base_url}/permits/by-address",
+                params={"address": address, "days_back": 365},
+                timeout=20
+            )
+        elif area:
+            response = self.session.get(
+                f"{self.base_url}/permits/by-area",
+                params={"neighborhood": area, "days_back": 90},
+                timeout=20
+            )
+        else:
+            return []
+        
+        response.raise_for_status()
+        return response.json()
+    
     def get_permits(self, address: str = None, area: str = None) -> List[Dict[str, Any]]:
         """Get building permits"""
         try:
-            if address:
-                response = self.session.get(
-                    f"{self.base_url}/permits/by-address",
-                    params={"address": address, "days_back": 365},
-                    timeout=20
-                )
-            elif area:
-                response = self.session.get(
-                    f"{self.base_url}/permits/by-area",
-                    params={"neighborhood": area, "days_back": 90},
-                    timeout=20
-                )
-            else:
-                return []
-            
-            response.raise_for_status()
-            return response.json()
+            return self.fetch_permits(address=address, area=area)
         except Exception as e:
             return []
     
@@ -129,15 +298,72 @@ class HDIClient:
         except Exception as e:
             return {"error": str(e)}
     
+    def generate_report_per_area(self, config: Dict[str, Any], max_workers: int = 4) -> Dict[str, Any]:
+        """Generate a per-area report with one bounded-concurrency request per area
+        
+        Both paths use the server's area limit, so the report covers the same
+        areas at any concurrency. Other report types go through a single
+        generate_report call. Areas whose request fails are listed under
+        "failed_areas" next to the sections that did generate.
+        """
+        max_areas = PER_AREA_REPORT_TYPES.get(config["report_type"])
+        if not max_areas:
+            return self.generate_report(config)
+        
+        areas = config["areas"][:max_areas]
+        config = {**config, "areas": areas}
+        if len(areas) < 2 or max_workers < 2:
+            return self.generate_report(config)
+        
+        # The first request covers the areas in the title, so its title is the
+        # one the server would give the whole report
+        title_areas = max(REPORT_TITLE_AREAS.get(config["report_type"], 1), 1)
+        groups = [areas[:title_areas]] + [[area] for area in areas[title_areas:]]
+        
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(groups))) as executor:
+            reports = list(executor.map(
+                lambda group: self.generate_report({**config, "areas": group}),
+                groups
+            ))
+        
+        succeeded, failed_areas = [], []
+        for group, report in zip(groups, reports):
+            error = report.get("error") or report.get("metadata", {}).get("error")
+            if error or not report.get("metadata", {}).get("success", True):
+                failed_areas.extend({"area": area, "error": error or "Report generation failed"}
+                                    for area in group)
+            else:
+                succeeded.append(report)
+        
+        if not succeeded:
+            return {"error": "; ".join(f"{f['area']}: {f['error']}" for f in failed_areas)}
+        
+        merged = dict(succeeded[0])
+        merged["areas"] = areas
+        merged["sections"] = {}
+        for report in succeeded:
+            merged["sections"].update(report.get("sections", {}))
+        merged["metadata"] = {
+            **succeeded[0].get("metadata", {}),
+            "generation_time": max(r.get("metadata", {}).get("generation_time", 0) for r in succeeded)
+        }
+        if failed_areas:
+            merged["failed_areas"] = failed_areas
+        return merged
+    
+    def fetch_analytics(self) -> Dict[str, Any]:
+        """Get platform analytics, raising on request errors"""
+        response = self.session.get(
+            f"{self.base_url}/analytics/stats/daily",
+            timeout=15
+        )
+        response.raise_for_status()
+        return response.json()
+    
     def get_analytics(self) -> Dict[str, Any]:
         """Get platform analytics"""
         try:
-            response = self.session.get(
-                f"{self.base_url}/analytics/stats/daily",
-                timeout=15
-            )
-            response.raise_for_status()
-            return response.json()
+            return self.fetch_analytics()
         except Exception as e:
             return {}
 
@@ -146,8 +372,85 @@ class HDIClient:
 def get_hdi_client():
     return HDIClient()
 
+# Cached read-only API calls, shared across reruns and sessions.
+# A failed call raises inside its cached function, so st.cache_data does not
+# store it and the next call retries; the wrappers below turn it back into the
+# client's usual failure value.
+class UncachedResult(Exception):
+    """Carries a failed API result out of a cached function without caching it"""
+    
+    def __init__(self, result: Dict[str, Any]):
+        super().__init__(result.get("error", "API call failed"))
+        self.result = result
+
+@st.cache_data(ttl=10, show_spinner=False)
+def api_online() -> bool:
+    return get_hdi_client().health_check()
+
+@st.cache_data(ttl=3600, show_spinner=False)
+def cached_search(query: str) -> Dict[str, Any]:
+    result = get_hdi_client().search_properties(query)
+    if not result.get("success"):
+        raise UncachedResult(result)
+    return result
+
+@st.cache_data(ttl=300, show_spinner=False)
+def cached_market_trends(area: str) -> Dict[str, Any]:
+    result = get_hdi_client().get_market_trends(area)
+    if not result.get("success"):
+        raise UncachedResult(result)
+    return result
+
+@st.cache_data(ttl=600, show_spinner=False)
+def cached_permits_by_area(area: str) -> List[Dict[str, Any]]:
+    return get_hdi_client().fetch_permits(area=area)
+
+@st.cache_data(ttl=60, show_spinner=False)
+def cached_analytics() -> Dict[str, Any]:
+    return get_hdi_client().fetch_analytics()
+
+def search_properties(query: str) -> Dict[str, Any]:
+    try:
+        return cached_search(query)
+    except UncachedResult as failure:
+        return failure.result
+
+def get_market_trends(area: str) -> Dict[str, Any]:
+    try:
+        return cached_market_trends(area)
+    except UncachedResult as failure:
+        return failure.result
+
+def get_area_permits(area: str) -> List[Dict[str, Any]]:
+    try:
+        return cached_permits_by_area(area)
+    except Exception:
+        return []
+
+def get_analytics() -> Dict[str, Any]:
+    try:
+        return cached_analytics()
+    except Exception:
+        return {}
+
+def prefetch_dashboard_data():
+    """Warm the analytics and default-area permits caches in the background
+    
+    Runs once per session so switching to those pages finds the data ready.
+    Market trends are not prefetched because each one is a paid LLM query.
+    """
+    if st.session_state.get("prefetched"):
+        return
+    st.session_state["prefetched"] = True
+    
+    executor = ThreadPoolExecutor(max_workers=2, initializer=add_script_run_ctx,
+                                  initargs=(None, get_script_run_ctx()))
+    executor.submit(get_analytics)
+    executor.submit(get_area_permits, HOUSTON_NEIGHBORHOODS[0])
+    executor.shutdown(wait=False)
+
 # Custom CSS
-st.markdown("""
+CUSTOM_CSS = """
 <style>
     .main-header {
         font-size: 2.5rem;
@@ -180,7 +483,15 @@ st.markdown("""
         background: #f0f2f6;
     }
 </style>
-""", unsafe_allow_html=True)
+"""
+# Collapsed once at import; this block is resent with every full rerun
+CUSTOM_CSS_HTML = " ".join(CUSTOM_CSS.split())
+
+def _inject_css():
+    """Emit the custom CSS block"""
+    # Not gated per session: Streamlit drops elements a full rerun does not
+    # re-emit, so the styles have to go out on every run of main()
+    st.markdown(CUSTOM_CSS_HTML, unsafe_allow_html=True)
 
 def render_header():
     """Render main header"""
@@ -192,8 +503,7 @@ def render_header():
     
     with col2:
         # API Health Check
-        client = get_hdi_client()
-        if client.health_check():
+        if api_online():
             st.success("API Online")
         else:
             st.error("API Offline")
@@ -205,17 +515,12 @@ def render_sidebar():
     """Render sidebar navigation"""
     st.sidebar.title("🔍 Navigation")
     
-    pages = {
-        "🏠 Property Search": "search",
-        "📊 Market Analysis": "market", 
-        "💰 Opportunities": "opportunities",
-        "🏗️ Permits": "permits",
-        "📋 Reports": "reports",
-        "📈 Analytics": "analytics"
-    }
+    selected = st.sidebar.radio("Select Page", PAGE_LABELS)
+    
+    if st.sidebar.button("Clear cache", key="clear_cache_btn"):
+        st.cache_data.clear()
     
-    selected = st.sidebar.radio("Select Page", list(pages.keys()))
-    return pages[selected]
+    return PAGES[selected]
 
 def render_property_search():
     """Property search page"""
@@ -238,13 +543,37 @@ def render_property_search():
         )
         
         if st.button("Search", key="search_btn") and query:
-            with st.spinner("Searching..."):
-                result = client.search_properties(query)
+            # Answers streamed earlier in this session are reused as-is
+            answers = st.session_state.setdefault("streamed_answers", {})
+            result = answers.get(query)
+            streamed = False
+            
+            if result is None:
+                result = {}
+                placeholder = st.empty()
+                try:
+                    with placeholder.container():
+                        st.markdown("### Results")
+                        st.write_stream(client.stream_query(query, result))
+                    streamed = bool(result)
+                except Exception:
+                    streamed = False
+                
+                if not streamed:
+                    # Streaming endpoint unavailable or failed; drop any partial answer
+                    placeholder.empty()
+                
+                if streamed:
+                    answers[query] = result
+                else:
+                    with st.spinner("Searching..."):
+                        result = search_properties(query)
             
             if result.get("success"):
                 st.success("Search completed!")
-                st.markdown("### Results")
-                st.write(result.get("data", "No results found"))
+                if not streamed:
+                    st.markdown("### Results")
+                    st.write(result.get("data", "No results found"))
                 
                 # Show metadata
                 if result.get("metadata"):
@@ -292,33 +621,64 @@ def render_property_search():
                 st.warning("Maximum 5 properties allowed for comparison")
                 address_list = address_list[:5]
             
-            st.info(f"Comparing {len(address_list)} properties...")
-            # Implementation would call bulk compare API
+            with st.spinner(f"Comparing {len(address_list)} properties..."):
+                comparison = client.bulk_compare(address_list)
+                if not comparison.get("error"):
+                    results = [
+                        {"error": prop.get("error") or "Analysis failed"} if not prop.get("success")
+                        else prop.get("data") or {}
+                        for prop in comparison.get("properties", [])
+                    ]
+                else:
+                    # Bulk endpoint unavailable, fall back to one request per address
+                    results = client.bulk_analyze(address_list)
+            
+            differences = (comparison.get("comparison") or {}).get("key_differences")
+            if differences:
+                st.markdown("### Key Differences")
+                for difference in differences:
+                    st.write(f"• {difference}")
+            
+            # Key metrics of every analyzed property, stacked into one table
+            metric_rows = [
+                {"Address": address, **property_metrics_row(result)}
+                for address, result in zip(address_list, results)
+                if not result.get("error")
+            ]
+            if metric_rows:
+                render_metrics_table(metric_rows)
+            
+            for address, result in zip(address_list, results):
+                with st.expander(address, expanded=True):
+                    if not result.get("error"):
+                        render_property_analysis(result, show_metrics=False)
+                    else:
+                        st.error(f"Analysis failed: {result['error']}")
+
+def property_metrics_row(data: Dict[str, Any]) -> Dict[str, str]:
+    """Key metrics of a property analysis as one table row"""
+    official_data = data.get("official_data", {})
+    row = {
+        label: str(official_data[key])
+        for label, key in (("Appraised Value", "appraised_value"),
+                           ("Year Built", "year_built"),
+                           ("Living Area", "living_area"))
+        if key in official_data
+    }
+    row["Confidence"] = f"{data.get('confidence_score', 0):.1%}"
+    return row
+
+def render_metrics_table(rows: List[Dict[str, str]]):
+    """Render key metrics rows as a single table element"""
+    st.dataframe(pd.DataFrame(rows), hide_index=True, use_container_width=True)
 
-def render_property_analysis(data: Dict[str, Any]):
+def render_property_analysis(data: Dict[str, Any], show_metrics: bool = True):
     """Render property analysis results"""
     st.success("Property analysis complete!")
     
     # Key metrics
-    col1, col2, col3, col4 = st.columns(4)
-    
-    official_data = data.get("official_data", {})
-    
-    with col1:
-        if "appraised_value" in official_data:
-            st.metric("Appraised Value", official_data["appraised_value"])
-    
-    with col2:
-        if "year_built" in official_data:
-            st.metric("Year Built", official_data["year_built"])
-    
-    with col3:
-        if "living_area" in official_data:
-            st.metric("Living Area", official_data["living_area"])
-    
-    with col4:
-        confidence = data.get("confidence_score", 0)
-        st.metric("Confidence", f"{confidence:.1%}")
+    if show_metrics:
+        render_metrics_table([property_metrics_row(data)])
     
     # Market insights
     if data.get("market_insights"):
@@ -363,24 +723,32 @@ def render_market_analysis():
     
     with col2:
         if st.button("Analyze Market", key="market_btn"):
-            client = get_hdi_client()
-            
             with st.spinner(f"Analyzing {selected_area} market..."):
-                result = client.get_market_trends(selected_area)
+                # Trends and permits are independent, fetch them together.
+                # Workers get this script's context so cached calls run as if inline.
+                with ThreadPoolExecutor(max_workers=2, initializer=add_script_run_ctx,
+                                        initargs=(None, get_script_run_ctx())) as executor:
+                    trends_future = executor.submit(get_market_trends, selected_area)
+                    permits_future = executor.submit(get_area_permits, selected_area)
+                    result = trends_future.result()
+                    permits = permits_future.result()
             
             if result.get("success"):
                 st.subheader(f"📈 {selected_area} Market Trends")
                 st.write(result.get("data", "No market data available"))
                 
-                # Get permits for the area
-                permits = client.get_permits(area=selected_area)
+                # Show permits for the area
                 if permits:
                     render_permits_chart(permits, selected_area)
             else:
                 st.error(f"Market analysis failed: {result.get('error', 'Unknown error')}")
 
+@st.fragment
 def render_opportunities():
-    """Investment opportunities page"""
+    """Investment opportunities page
+    
+    Runs as a fragment, so criteria widgets only rerun this page.
+    """
     st.header("💰 Investment Opportunities")
     
     # Search criteria
@@ -391,7 +759,7 @@ def render_opportunities():
             neighborhoods = st.multiselect(
                 "Neighborhoods",
                 HOUSTON_NEIGHBORHOODS,
-                default=["Houston Heights", "Montrose"]
+                default=DEFAULT_OPPORTUNITY_NEIGHBORHOODS
             )
             
             max_price = st.number_input(
@@ -405,8 +773,8 @@ def render_opportunities():
         with col2:
             property_types = st.multiselect(
                 "Property Types",
-                ["single-family", "multi-family", "condo", "townhouse"],
-                default=["single-family", "multi-family"]
+                PROPERTY_TYPES,
+                default=DEFAULT_PROPERTY_TYPES
             )
             
             min_cap_rate = st.slider(
@@ -444,43 +812,52 @@ def render_opportunities():
             else:
                 st.info("No opportunities found matching your criteria")
 
+def _opportunity_card_html(rank: int, opp: Dict[str, Any]) -> str:
+    """HTML card with an opportunity's address and top match reasons"""
+    reasons = "".join(f"<li>{escape(str(reason))}</li>" for reason in opp.get('match_reasons', [])[:3])
+    if reasons:
+        reasons = f"<p><strong>Why this is a good match:</strong></p><ul>{reasons}</ul>"
+    
+    return (
+        '<div class="opportunity-card">'
+        f"<h4>#{rank}. {escape(str(opp.get('address', 'Unknown Address')))}</h4>"
+        f"{reasons}"
+        "</div>"
+    )
+
 def render_opportunities_results(opportunities: List[Dict[str, Any]]):
     """Render opportunities search results"""
     st.success(f"Found {len(opportunities)} investment opportunities!")
     
-    for i, opp in enumerate(opportunities, 1):
-        with st.container():
-            st.markdown(f"""
-            <div class="opportunity-card">
-                <h4>#{i}. {opp.get('address', 'Unknown Address')}</h4>
-            </div>
-            """, unsafe_allow_html=True)
-            
-            col1, col2, col3, col4 = st.columns(4)
-            
-            with col1:
-                if 'estimated_price' in opp:
-                    st.metric("Est. Price", f"${opp['estimated_price']:,.0f}")
-            
-            with col2:
-                if 'match_score' in opp:
-                    st.metric("Match Score", f"{opp['match_score']:.1f}/10")
-            
-            with col3:
-                if 'estimated_roi' in opp:
-                    st.metric("Est. ROI", f"{opp['estimated_roi']:.1%}")
-            
-            with col4:
-                if 'cap_rate' in opp:
-                    st.metric("Cap Rate", f"{opp['cap_rate']:.1%}")
-            
-            # Match reasons
-            if opp.get('match_reasons'):
-                st.write("**Why this is a good match:**")
-                for reason in opp['match_reasons'][:3]:
-                    st.write(f"• {reason}")
-            
-            st.divider()
+    # One table for all metrics and one markdown element for all cards,
+    # instead of a card, four columns and four metrics per opportunity
+    metrics = pd.DataFrame([
+        {
+            "#": i,
+            "Address": opp.get('address', 'Unknown Address'),
+            "Est. Price": opp.get('estimated_price'),
+            "Match Score": opp.get('match_score'),
+            "Est. ROI": opp['estimated_roi'] * 100 if 'estimated_roi' in opp else None,
+            "Cap Rate": opp['cap_rate'] * 100 if 'cap_rate' in opp else None
+        }
+        for i, opp in enumerate(opportunities, 1)
+    ])
+    st.dataframe(
+        metrics,
+        hide_index=True,
+        use_container_width=True,
+        column_config={
+            "Est. Price": st.column_config.NumberColumn(format="$%d"),
+            "Match Score": st.column_config.NumberColumn(format="%.1f/10"),
+            "Est. ROI": st.column_config.NumberColumn(format="%.1f%%"),
+            "Cap Rate": st.column_config.NumberColumn(format="%.1f%%")
+        }
+    )
+    
+    st.markdown(
+        "".join(_opportunity_card_html(i, opp) for i, opp in enumerate(opportunities, 1)),
+        unsafe_allow_html=True
+    )
 
 def render_permits():
     """Permits analysis page"""
@@ -505,27 +882,57 @@ def render_permits():
     else:
         neighborhood = st.selectbox("Select Neighborhood", HOUSTON_NEIGHBORHOODS)
         if st.button("Get Area Permits", key="permits_area_btn"):
-            permits = client.get_permits(area=neighborhood)
+            permits = get_area_permits(neighborhood)
             if permits:
                 render_permits_table(permits)
                 render_permits_chart(permits, neighborhood)
             else:
                 st.info(f"No recent permits found in {neighborhood}")
 
+@st.cache_data(ttl=600, show_spinner=False)
+def permits_dataframe(permits: List[Dict[str, Any]]) -> "pd.DataFrame":
+    """Build the permits DataFrame once per permits payload"""
+    # Only the columns the dashboard uses; drop any the API did not return
+    df = pd.DataFrame.from_records(permits, columns=PERMIT_COLUMNS).dropna(axis=1, how='all')
+    
+    # Compact dtypes for large permit lists
+    if 'permit_type' in df.columns:
+        df['permit_type'] = df['permit_type'].astype('category')
+    if 'estimated_cost' in df.columns:
+        # Dollar amounts stay float64; float32 loses cents above ~16.7M
+        df['estimated_cost'] = pd.to_numeric(df['estimated_cost'], errors='coerce')
+    if 'issue_date' in df.columns:
+        df['issue_date'] = pd.to_datetime(df['issue_date'], errors='coerce')
+    
+    return df
+
+@st.cache_data(ttl=600, show_spinner=False)
+def permits_type_summary(permits: List[Dict[str, Any]]) -> Optional["pd.DataFrame"]:
+    """Permit count and total value per permit type, once per permits payload"""
+    df = permits_dataframe(permits)
+    
+    if 'estimated_cost' not in df.columns or 'permit_type' not in df.columns:
+        return None
+    
+    # Categorical keys and a float column keep this on pandas' vectorized groupby path
+    return df.groupby('permit_type', observed=True)['estimated_cost'].agg(
+        count='count',
+        total_value='sum'
+    ).reset_index()
+
 def render_permits_table(permits: List[Dict[str, Any]]):
     """Render permits as a table"""
     if not permits:
         return
     
-    df = pd.DataFrame(permits)
+    df = permits_dataframe(permits)
     
     # Select relevant columns
-    display_columns = ['address', 'permit_type', 'description', 'estimated_cost', 'issue_date', 'status']
-    available_columns = [col for col in display_columns if col in df.columns]
+    available_columns = [col for col in PERMIT_COLUMNS if col in df.columns]
     
     if available_columns:
         st.dataframe(
-            df[available_columns].head(20),
+            df.loc[:, available_columns].head(20),
             use_container_width=True
         )
 
@@ -534,15 +941,14 @@ def render_permits_chart(permits: List[Dict[str, Any]], area: str):
     if not permits:
         return
     
+    import plotly.express as px
+    
     st.subheader(f"📊 Permit Activity in {area}")
     
-    df = pd.DataFrame(permits)
+    # Group by permit type
+    type_summary = permits_type_summary(permits)
     
-    if 'estimated_cost' in df.columns and 'permit_type' in df.columns:
-        # Group by permit type
-        type_summary = df.groupby('permit_type')['estimated_cost'].agg(['count', 'sum']).reset_index()
-        type_summary.columns = ['permit_type', 'count', 'total_value']
-        
+    if type_summary is not None:
         col1, col2 = st.columns(2)
         
         with col1:
@@ -569,27 +975,26 @@ def render_permits_chart(permits: List[Dict[str, Any]], area: str):
 
 def render_reports():
     """Reports generation page"""
+    # Per-area requests in flight at once; the backend saturates well before 8.
+    # Sidebar widgets cannot live inside the fragment below.
+    report_concurrency = st.sidebar.slider("Report concurrency", 1, 8, 4)
+    render_report_builder(report_concurrency)
+
+@st.fragment
+def render_report_builder(report_concurrency: int):
+    """Report configuration and results, rerun on its own as a fragment"""
     st.header("📋 Automated Reports")
     
     # Report configuration
     col1, col2 = st.columns([2, 1])
     
     with col1:
-        report_type = st.selectbox(
-            "Report Type",
-            [
-                "daily_market",
-                "weekly_summary", 
-                "neighborhood_focus",
-                "investment_opportunities",
-                "permit_activity"
-            ]
-        )
+        report_type = st.selectbox("Report Type", REPORT_TYPES)
         
         areas = st.multiselect(
             "Areas to Include",
             HOUSTON_NEIGHBORHOODS,
-            default=["Houston Heights", "Montrose"]
+            default=DEFAULT_REPORT_AREAS
         )
     
     with col2:
@@ -612,16 +1017,28 @@ def render_reports():
         client = get_hdi_client()
         
         with st.spinner("Generating report..."):
-            result = client.generate_report(config)
+            result = client.generate_report_per_area(config, max_workers=report_concurrency)
         
         if not result.get("error"):
             render_report_results(result)
         else:
             st.error(f"Report generation failed: {result['error']}")
 
+@st.cache_data(ttl=3600, max_entries=32, show_spinner=False)
+def report_json_bytes(generated_at: str, title: str, _report: Dict[str, Any]) -> bytes:
+    """Serialize a report for download once; keyed by its generation time and title"""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(_report, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY)
+    return json.dumps(_report, indent=2).encode()
+
 def render_report_results(report: Dict[str, Any]):
     """Render generated report"""
-    st.success("Report generated successfully!")
+    failed_areas = report.get("failed_areas")
+    if failed_areas:
+        st.warning("Report generated without: " +
+                   ", ".join(f"{f['area']} ({f['error']})" for f in failed_areas))
+    else:
+        st.success("Report generated successfully!")
     
     # Report header
     st.subheader(report.get("title", "HDI Report"))
@@ -651,7 +1068,7 @@ def render_report_results(report: Dict[str, Any]):
         if st.button("Download JSON"):
             st.download_button(
                 label="Download JSON",
-                data=json.dumps(report, indent=2),
+                data=report_json_bytes(report.get("generated_at", ""), report.get("title", ""), report),
                 file_name=f"hdi_report_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json",
                 mime="application/json"
             )
@@ -662,10 +1079,11 @@ def render_report_results(report: Dict[str, Any]):
 
 def render_analytics():
     """Platform analytics page"""
+    import plotly.express as px
+    
     st.header("📈 Platform Analytics")
     
-    client = get_hdi_client()
-    analytics = client.get_analytics()
+    analytics = get_analytics()
     
     if analytics:
         # Key metrics
@@ -715,6 +1133,8 @@ def render_analytics():
 
 def main():
     """Main application"""
+    _inject_css()
+    prefetch_dashboard_data()
     render_header()
     
     # Sidebar navigation
@@ -0,0 +1,21 @@
+"""Gunicorn settings, loaded automatically from the working directory"""
+
+# Build the app once in the master; workers fork with routes, models and
+# module caches already in memory and share those pages copy-on-write
+preload_app = True
+
+workers = 4
+worker_class = "gthread"
+threads = 8
+timeout = 120
+
+def pre_fork(server, worker):
+    """Close the master's database connections before a worker is forked"""
+    from backend.database.connection_pool import db_pool
+    if not db_pool.get_pool_status().get('closed', True):
+        db_pool.close_all()
+
+def post_fork(server, worker):
+    """Give each worker its own database connections"""
+    from backend.database.connection_pool import db_pool
+    db_pool.reopen()
@@ -5,10 +5,25 @@ import sys
 import os
 import argparse
 import json
-import requests
-from datetime import datetime
+import time
+from contextlib import contextmanager
+from importlib.util import find_spec
 from typing import List, Optional
-from tabulate import tabulate
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# HTTP clients are imported by the commands that use them, so --help and
+# argument errors return without loading them; find_spec checks they are
+# installed without importing them
+AIOHTTP_AVAILABLE = find_spec("aiohttp") is not None
+REQUESTS_CACHE_AVAILABLE = find_spec("requests_cache") is not None
+IJSON_AVAILABLE = find_spec("ijson") is not None
+# h2 is required by httpx for http2=True
+HTTP2_AVAILABLE = find_spec("httpx") is not None and find_spec("h2") is not None
 
 # Add project to path
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
@@ -16,12 +31,122 @@ sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 # Default API endpoint
 DEFAULT_API_URL = "http://localhost:5000/api/v1"
 
+# The bulk endpoint accepts at most 50 addresses per request
+BULK_CHUNK_SIZE = 50
+BULK_CONCURRENCY = 8
+
+# On-disk cache for GET responses; usage analytics are always fetched fresh
+HTTP_CACHE_PATH = os.path.expanduser("~/.hdi/http_cache")
+HTTP_CACHE_TTL = 300
+
+# Report bodies are streamed in chunks of this size
+STREAM_CHUNK_SIZE = 65536
+REPORT_PREVIEW_BYTES = 300
+REPORT_HEADER_FIELDS = ("title", "generated_at", "report_id")
+
+# Request bodies above this size are gzipped; a 50-address bulk chunk is ~2 KB
+GZIP_MIN_SIZE = 1024
+
+# HTTP/2 connect timeout; bulk analyses and reports can run for minutes, so
+# reads are unbounded as they are on requests
+HTTP2_CONNECT_TIMEOUT = 5.0
+
+def json_loads(data: bytes):
+    """Parse a JSON response body, with orjson when installed"""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return json.loads(data)
+
+def write_json(path: str, data) -> None:
+    """Save data as indented JSON, with orjson when installed"""
+    if ORJSON_AVAILABLE:
+        with open(path, 'wb') as f:
+            f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+    else:
+        with open(path, 'w') as f:
+            json.dump(data, f, indent=2)
+
+def encode_json_body(payload, compress: bool = True):
+    """JSON request body and headers, gzipped when larger than GZIP_MIN_SIZE"""
+    body = orjson.dumps(payload) if ORJSON_AVAILABLE else json.dumps(payload).encode()
+    headers = {"Content-Type": "application/json"}
+    if compress and len(body) > GZIP_MIN_SIZE:
+        import gzip
+        # Level 1: address lists compress well even at the fastest setting
+        body = gzip.compress(body, compresslevel=1)
+        headers["Content-Encoding"] = "gzip"
+    return body, headers
+
+def summarize_section(section_data):
+    """(kind, detail) printed for one report section"""
+    if isinstance(section_data, dict):
+        return "dict", list(section_data.keys())[:2]  # First 2 keys
+    if isinstance(section_data, list):
+        return "list", len(section_data)
+    return "value", str(section_data)[:100]
+
+class ChunkReader:
+    """File-like read() over an iterator of byte chunks, as ijson expects"""
+    
+    def __init__(self, chunks):
+        self._chunks = iter(chunks)
+    
+    def read(self, size: int = -1) -> bytes:
+        # ijson probes the stream type with read(0) and accepts short reads;
+        # an empty read is end of stream
+        if size == 0:
+            return b""
+        return next(self._chunks, b"")
+
 class HDICli:
     """Command line interface for HDI"""
     
-    def __init__(self, api_url: str = DEFAULT_API_URL):
+    def __init__(self, api_url: str = DEFAULT_API_URL, use_cache: bool = True):
         self.api_url = api_url.rstrip('/')
-        self.session = requests.Session()
+        self.use_cache = use_cache
+        # HTTP/2 is only negotiated over TLS, so plain http:// stays on HTTP/1.1
+        self.http2 = HTTP2_AVAILABLE and self.api_url.startswith("https://")
+        self.session = self._create_session()
+    
+    def _create_session(self):
+        """HTTP/2 client for TLS APIs, pooled requests session otherwise
+        
+        Both expose the same get/post/raise_for_status/content calls used below.
+        """
+        if self.http2:
+            import httpx
+            return httpx.Client(
+                http2=True,
+                timeout=httpx.Timeout(None, connect=HTTP2_CONNECT_TIMEOUT),
+                limits=httpx.Limits(max_connections=32, max_keepalive_connections=16)
+            )
+        
+        import requests
+        from requests.adapters import HTTPAdapter
+        from urllib3.util.retry import Retry
+        
+        if self.use_cache and REQUESTS_CACHE_AVAILABLE:
+            import requests_cache
+            session = requests_cache.CachedSession(
+                cache_name=HTTP_CACHE_PATH,
+                backend="sqlite",
+                expire_after=HTTP_CACHE_TTL,
+                urls_expire_after={"*/analytics/*": requests_cache.DO_NOT_CACHE},
+                allowable_methods=("GET",),
+                stale_if_error=True
+            )
+        else:
+            session = requests.Session()
+        
+        # Keep-alive pool sized for the concurrent commands, retrying transient gateway errors
+        adapter = HTTPAdapter(
+            pool_connections=16,
+            pool_maxsize=32,
+            max_retries=Retry(total=3, backoff_factor=0.3, status_forcelist=[502, 503, 504])
+        )
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+        return session
     
     def search(self, query: str) -> None:
         """Natural language property search"""
@@ -34,7 +159,7 @@ class HDICli:
             )
             response.raise_for_status()
             
-            data = response.json()
+            data = json_loads(response.content)
             if data.get("success"):
                 print(data.get("data", "No results found"))
                 
@@ -55,62 +180,66 @@ class HDICli:
         print(f"🏠 Analyzing: {address}\n")
         
         try:
+            # Collapse whitespace so spacing variants share one cache entry
             response = self.session.get(
                 f"{self.api_url}/properties/analyze",
-                params={"address": address}
+                params={"address": " ".join(address.split())}
             )
             response.raise_for_status()
             
-            data = response.json()
-            
-            # Show official data if available
-            if data.get("official_data"):
-                print("📋 Official Data (HCAD):")
-                official = data["official_data"]
-                if "appraised_value" in official:
-                    print(f"  Appraised Value: {official['appraised_value']}")
-                if "year_built" in official:
-                    print(f"  Year Built: {official['year_built']}")
-                if "living_area" in official:
-                    print(f"  Living Area: {official['living_area']}")
-                print()
-            
-            # Show market insights
-            if data.get("market_insights"):
-                print("📈 Market Insights:")
-                insights = data["market_insights"]
-                # Truncate long insights
-                if len(insights) > 500:
-                    print(f"  {insights[:500]}...")
-                else:
-                    print(f"  {insights}")
-                print()
-            
-            # Show recommendations
-            if data.get("recommendations"):
-                print("💡 Recommendations:")
-                for rec in data["recommendations"]:
-                    print(f"  • {rec}")
-                print()
-            
-            # Show confidence score
-            print(f"🎯 Confidence Score: {data.get('confidence_score', 0):.1%}")
+            self._print_analysis(json_loads(response.content))
             
         except Exception as e:
             print(f"❌ Error: {str(e)}")
     
+    def _print_analysis(self, data: dict) -> None:
+        """Print a property analysis response"""
+        # Show official data if available
+        if data.get("official_data"):
+            print("📋 Official Data (HCAD):")
+            official = data["official_data"]
+            if "appraised_value" in official:
+                print(f"  Appraised Value: {official['appraised_value']}")
+            if "year_built" in official:
+                print(f"  Year Built: {official['year_built']}")
+            if "living_area" in official:
+                print(f"  Living Area: {official['living_area']}")
+            print()
+        
+        # Show market insights
+        if data.get("market_insights"):
+            print("📈 Market Insights:")
+            insights = data["market_insights"]
+            # Truncate long insights
+            if len(insights) > 500:
+                print(f"  {insights[:500]}...")
+            else:
+                print(f"  {insights}")
+            print()
+        
+        # Show recommendations
+        if data.get("recommendations"):
+            print("💡 Recommendations:")
+            for rec in data["recommendations"]:
+                print(f"  • {rec}")
+            print()
+        
+        # Show confidence score
+        print(f"🎯 Confidence Score: {data.get('confidence_score', 0):.1%}")
+    
     def compare(self, addresses: List[str]) -> None:
         """Compare multiple properties"""
         print(f"⚖️  Comparing {len(addresses)} properties\n")
         
         try:
-            response = self.session.get(
+            # JSON body: no URL length limit, and commas inside addresses survive
+            response = self.session.post(
                 f"{self.api_url}/bulk/compare",
-                params={"addresses": ",".join(addresses)}
+                json={"addresses": addresses}
             )
             response.raise_for_status()
             
-            data = response.json()
+            data = json_loads(response.content)
             
             # Show summary
             if data.get("summary"):
@@ -149,52 +278,107 @@ class HDICli:
             )
             response.raise_for_status()
             
-            data = response.json()
-            if data.get("success"):
-                print(data.get("data", "No market data available"))
-            else:
-                print("❌ Failed to get market data")
+            self._print_market(json_loads(response.content))
                 
         except Exception as e:
             print(f"❌ Error: {str(e)}")
     
+    def _print_market(self, data: dict) -> None:
+        """Print a market trends response"""
+        if data.get("success"):
+            print(data.get("data", "No market data available"))
+        else:
+            print("❌ Failed to get market data")
+    
     def stats(self) -> None:
         """Show usage statistics"""
         print("📊 HDI Usage Statistics\n")
         
         try:
-            # Get today's stats
-            response = self.session.get(f"{self.api_url}/analytics/stats/daily")
-            response.raise_for_status()
-            today_stats = response.json()
+            # Today's stats and insights are independent, so fetch both at once
+            from concurrent.futures import ThreadPoolExecutor
             
-            print("Today's Stats:")
-            print(f"  Total Queries: {today_stats.get('total_queries', 0)}")
-            print(f"  Cache Hit Rate: {today_stats.get('cache_hit_rate', 0):.1%}")
-            print(f"  Total Cost: ${today_stats.get('total_cost', 0):.2f}")
-            print(f"  Avg Response Time: {today_stats.get('average_response_time', 0):.2f}s")
-            print()
+            with ThreadPoolExecutor(max_workers=2) as executor:
+                stats_future = executor.submit(self.session.get, f"{self.api_url}/analytics/stats/daily")
+                insights_future = executor.submit(self.session.get, f"{self.api_url}/analytics/insights")
+                stats_response = stats_future.result()
+                insights_response = insights_future.result()
             
-            # Get insights
-            response = self.session.get(f"{self.api_url}/analytics/insights")
-            response.raise_for_status()
-            insights_data = response.json()
+            stats_response.raise_for_status()
+            self._print_stats(json_loads(stats_response.content))
+            print()
             
-            if insights_data.get("insights"):
-                print("💡 Insights:")
-                for insight in insights_data["insights"][:3]:  # Top 3
-                    icon = "⚠️" if insight["priority"] == "high" else "ℹ️"
-                    print(f"  {icon} {insight['message']}")
+            insights_response.raise_for_status()
+            self._print_insights(json_loads(insights_response.content))
             
         except Exception as e:
             print(f"❌ Error getting stats: {str(e)}")
     
+    def _print_stats(self, today_stats: dict) -> None:
+        """Print a daily stats response"""
+        print("Today's Stats:")
+        print(f"  Total Queries: {today_stats.get('total_queries', 0)}")
+        print(f"  Cache Hit Rate: {today_stats.get('cache_hit_rate', 0):.1%}")
+        print(f"  Total Cost: ${today_stats.get('total_cost', 0):.2f}")
+        print(f"  Avg Response Time: {today_stats.get('average_response_time', 0):.2f}s")
+    
+    def _print_insights(self, insights_data: dict) -> None:
+        """Print an analytics insights response"""
+        if insights_data.get("insights"):
+            print("💡 Insights:")
+            for insight in insights_data["insights"][:3]:  # Top 3
+                icon = "⚠️" if insight["priority"] == "high" else "ℹ️"
+                print(f"  {icon} {insight['message']}")
+    
+    def batch(self, sub_requests: List[dict]) -> List[dict]:
+        """Send several GET requests in one round trip
+        
+        Each sub-request is {"method": "GET", "path": ..., "params": {...}}, with
+        paths relative to the API root. Returns {"status", "body"} per
+        sub-request, in order.
+        """
+        response = self._post_json(f"{self.api_url}/batch/requests", {"requests": sub_requests})
+        response.raise_for_status()
+        return json_loads(response.content)["responses"]
+    
+    def dash(self, area: Optional[str] = None, address: Optional[str] = None) -> None:
+        """Show stats, market trends and a property analysis from one batched request"""
+        print("🧭 HDI Dashboard\n")
+        
+        # (heading, printer, sub-request) per section, in display order
+        sections = [
+            (None, self._print_stats, {"path": "/analytics/stats/daily"}),
+            (None, self._print_insights, {"path": "/analytics/insights"})
+        ]
+        if area:
+            sections.append((f"📈 Market Analysis: {area}", self._print_market,
+                             {"path": "/market/trends", "params": {"area": area}}))
+        if address:
+            sections.append((f"🏠 Analyzing: {address}", self._print_analysis,
+                             {"path": "/properties/analyze",
+                              "params": {"address": " ".join(address.split())}}))
+        
+        try:
+            responses = self.batch([{"method": "GET", **sub} for _, _, sub in sections])
+            
+            for (heading, print_section, sub), result in zip(sections, responses):
+                if heading:
+                    print(f"{heading}\n")
+                if result["status"] == 200:
+                    print_section(result["body"])
+                else:
+                    print(f"❌ {sub['path']} failed with status {result['status']}")
+                print()
+                
+        except Exception as e:
+            print(f"❌ Error: {str(e)}")
+    
     def bulk(self, addresses_file: str, analysis_type: str = "standard") -> None:
         """Bulk analyze properties from a file"""
         try:
-            # Read addresses from file
+            # Read addresses from file, stripping each line once
             with open(addresses_file, 'r') as f:
-                addresses = [line.strip() for line in f if line.strip()]
+                addresses = [address for address in (line.strip() for line in f) if address]
             
             if not addresses:
                 print("❌ No addresses found in file")
@@ -202,18 +386,12 @@ class HDICli:
             
             print(f"📦 Bulk analyzing {len(addresses)} properties ({analysis_type} mode)\n")
             
-            # Call bulk API
-            response = self.session.post(
-                f"{self.api_url}/bulk/analyze",
-                json={
-                    "addresses": addresses,
-                    "analysis_type": analysis_type,
-                    "include_comparisons": True
-                }
-            )
-            response.raise_for_status()
-            
-            data = response.json()
+            # Call bulk API, one request per chunk of addresses
+            if self.http2 or AIOHTTP_AVAILABLE:
+                import asyncio
+                data = asyncio.run(self._bulk_async(addresses, analysis_type))
+            else:
+                data = self._bulk_sync(addresses, analysis_type)
             
             # Show results
             print(f"✅ Completed in {data.get('processing_time', 0):.1f} seconds")
@@ -227,13 +405,225 @@ class HDICli:
             
             # Save results
             output_file = addresses_file.replace('.txt', '_results.json')
-            with open(output_file, 'w') as f:
-                json.dump(data, f, indent=2)
+            write_json(output_file, data)
             print(f"\n📁 Full results saved to: {output_file}")
             
         except Exception as e:
             print(f"❌ Error: {str(e)}")
     
+    def _post_json(self, url: str, payload):
+        """POST payload as JSON, gzipped when large; resent uncompressed on a 415"""
+        # httpx takes raw bytes as content=, requests as data=
+        body_arg = "content" if self.http2 else "data"
+        body, headers = encode_json_body(payload)
+        response = self.session.post(url, headers=headers, **{body_arg: body})
+        if response.status_code == 415 and "Content-Encoding" in headers:
+            body, headers = encode_json_body(payload, compress=False)
+            response = self.session.post(url, headers=headers, **{body_arg: body})
+        return response
+    
+    def _bulk_payload(self, chunk: List[str], analysis_type: str) -> dict:
+        """Request body for one chunk of addresses"""
+        return {
+            "addresses": chunk,
+            "analysis_type": analysis_type,
+            "include_comparisons": True
+        }
+    
+    async def _bulk_async(self, addresses: List[str], analysis_type: str,
+                          chunk_size: int = BULK_CHUNK_SIZE,
+                          concurrency: int = BULK_CONCURRENCY) -> dict:
+        """POST address chunks to the bulk endpoint concurrently"""
+        import asyncio
+        
+        url = f"{self.api_url}/bulk/analyze"
+        chunks = [addresses[i:i + chunk_size] for i in range(0, len(addresses), chunk_size)]
+        semaphore = asyncio.Semaphore(concurrency)
+        start = time.perf_counter()
+        
+        if self.http2:
+            import httpx
+            
+            # All chunks multiplexed as streams on one HTTP/2 connection
+            timeout = httpx.Timeout(None, connect=HTTP2_CONNECT_TIMEOUT)
+            async with httpx.AsyncClient(http2=True, timeout=timeout) as client:
+                async def post_chunk(chunk: List[str]) -> dict:
+                    payload = self._bulk_payload(chunk, analysis_type)
+                    async with semaphore:
+                        body, headers = encode_json_body(payload)
+                        response = await client.post(url, content=body, headers=headers)
+                        if response.status_code == 415 and "Content-Encoding" in headers:
+                            body, headers = encode_json_body(payload, compress=False)
+                            response = await client.post(url, content=body, headers=headers)
+                        response.raise_for_status()
+                        return json_loads(response.content)
+                
+                results = await asyncio.gather(*(post_chunk(chunk) for chunk in chunks),
+                                               return_exceptions=True)
+            results = self._chunk_results(chunks, results, analysis_type)
+            return self._merge_bulk_results(results, time.perf_counter() - start)
+        
+        import aiohttp
+        
+        connector = aiohttp.TCPConnector(limit=concurrency, keepalive_timeout=30)
+        async with aiohttp.ClientSession(connector=connector) as session:
+            async def post_chunk(chunk: List[str]) -> dict:
+                payload = self._bulk_payload(chunk, analysis_type)
+                async with semaphore:
+                    body, headers = encode_json_body(payload)
+                    async with session.post(url, data=body, headers=headers) as response:
+                        if response.status != 415 or "Content-Encoding" not in headers:
+                            response.raise_for_status()
+                            return json_loads(await response.read())
+                    
+                    # Server refused gzip: resend uncompressed
+                    body, headers = encode_json_body(payload, compress=False)
+                    async with session.post(url, data=body, headers=headers) as response:
+                        response.raise_for_status()
+                        return json_loads(await response.read())
+            
+            results = await asyncio.gather(*(post_chunk(chunk) for chunk in chunks),
+                                           return_exceptions=True)
+        
+        results = self._chunk_results(chunks, results, analysis_type)
+        return self._merge_bulk_results(results, time.perf_counter() - start)
+    
+    def _bulk_sync(self, addresses: List[str], analysis_type: str,
+                   chunk_size: int = BULK_CHUNK_SIZE) -> dict:
+        """POST address chunks to the bulk endpoint one after another"""
+        start = time.perf_counter()
+        results = []
+        for i in range(0, len(addresses), chunk_size):
+            chunk = addresses[i:i + chunk_size]
+            try:
+                response = self._post_json(
+                    f"{self.api_url}/bulk/analyze",
+                    self._bulk_payload(chunk, analysis_type)
+                )
+                response.raise_for_status()
+                results.append(json_loads(response.content))
+            except Exception as e:
+                results.append(self._failed_chunk_result(chunk, e, analysis_type))
+        
+        return self._merge_bulk_results(results, time.perf_counter() - start)
+    
+    def _chunk_results(self, chunks: List[List[str]], results: list,
+                       analysis_type: str) -> List[dict]:
+        """Replace chunks that raised with per-address failure entries"""
+        merged = []
+        for chunk, result in zip(chunks, results):
+            if isinstance(result, Exception):
+                result = self._failed_chunk_result(chunk, result, analysis_type)
+            elif isinstance(result, BaseException):
+                raise result
+            merged.append(result)
+        return merged
+    
+    def _failed_chunk_result(self, chunk: List[str], error: Exception,
+                             analysis_type: str) -> dict:
+        """Bulk response for a chunk whose request failed, one entry per address"""
+        message = str(error) or type(error).__name__
+        return {
+            "properties": [
+                {"address": address, "success": False, "data": None, "error": message}
+                for address in chunk
+            ],
+            "opportunities": [],
+            "total_properties": len(chunk),
+            "successful_analyses": 0,
+            "analysis_type": analysis_type,
+            "summary": None,
+            "comparison": None,
+            "rankings": None
+        }
+    
+    def _merge_bulk_results(self, results: List[dict], elapsed: float) -> dict:
+        """Combine per-chunk bulk responses into one result"""
+        if len(results) == 1:
+            return results[0]
+        
+        # Summaries, comparisons and rankings only cover their own chunk,
+        # so they are kept per chunk rather than merged
+        return {
+            "properties": [p for r in results for p in r.get("properties") or []],
+            "opportunities": [o for r in results for o in r.get("opportunities") or []],
+            "total_properties": sum(r.get("total_properties") or 0 for r in results),
+            "successful_analyses": sum(r.get("successful_analyses") or 0 for r in results),
+            "processing_time": elapsed,
+            "analysis_type": results[0].get("analysis_type"),
+            "chunks": [
+                {
+                    "summary": r.get("summary"),
+                    "comparison": r.get("comparison"),
+                    "rankings": r.get("rankings")
+                }
+                for r in results
+            ]
+        }
+    
+    @contextmanager
+    def _stream_post(self, url: str, **kwargs):
+        """POST without reading the body; yields the response and its byte chunks"""
+        if self.http2:
+            with self.session.stream("POST", url, **kwargs) as response:
+                yield response, response.iter_bytes(STREAM_CHUNK_SIZE)
+        else:
+            with self.session.post(url, stream=True, **kwargs) as response:
+                yield response, response.iter_content(STREAM_CHUNK_SIZE)
+    
+    def _print_report(self, report: dict, sections: dict) -> None:
+        """Print a report's header and its section summaries"""
+        print(f"✅ {report['title']}")
+        print(f"   Generated: {report['generated_at']}")
+        print(f"   Report ID: {report['report_id']}")
+        print(f"   Sections: {len(sections)}")
+        
+        # Show section summaries
+        for section_name, (kind, detail) in sections.items():
+            print(f"\n📌 {section_name.replace('_', ' ').title()}:")
+            if kind == "dict":
+                for key in detail:
+                    print(f"    - {key}")
+            elif kind == "list":
+                print(f"    - {detail} items")
+            else:
+                print(f"    - {detail}...")
+    
+    def _stream_report_summary(self, chunks):
+        """Report header fields and section summaries, parsed incrementally
+        
+        Memory stays proportional to the printed fields, not the report size.
+        """
+        import ijson
+        
+        report, sections = {}, {}
+        name = section_prefix = item_prefix = None
+        for prefix, event, value in ijson.parse(ChunkReader(chunks)):
+            if prefix in REPORT_HEADER_FIELDS:
+                report[prefix] = value
+            elif prefix == "sections" and event == "map_key":
+                name = value
+                section_prefix = f"sections.{name}"
+                item_prefix = f"{section_prefix}.item"
+            elif name is None:
+                continue
+            elif prefix == section_prefix:
+                if event == "start_map":
+                    sections[name] = ("dict", [])
+                elif event == "start_array":
+                    sections[name] = ("list", 0)
+                elif event == "map_key":
+                    keys = sections[name][1]
+                    if len(keys) < 2:  # First 2 keys
+                        keys.append(value)
+                elif event not in ("end_map", "end_array"):
+                    sections[name] = ("value", str(value)[:100])
+            elif prefix == item_prefix and event not in ("map_key", "end_map", "end_array"):
+                # Start of each list item
+                sections[name] = ("list", sections[name][1] + 1)
+        
+        return report, sections
+    
     def report(self, report_type: str, areas: List[str], format_type: str = "json", 
                save: bool = False, no_permits: bool = False, no_opportunities: bool = False,
                include_analytics: bool = False, max_opportunities: int = 10) -> None:
@@ -250,53 +640,52 @@ class HDICli:
         }
         
         try:
-            response = self.session.post(
+            with self._stream_post(
                 f"{self.api_url}/reports/generate",
                 json=config,
                 params={"format": format_type}
-            )
-            response.raise_for_status()
-            
-            if format_type == "json":
-                report = response.json()
-                print(f"✅ {report['title']}")
-                print(f"   Generated: {report['generated_at']}")
-                print(f"   Report ID: {report['report_id']}")
-                print(f"   Sections: {len(report['sections'])}")
+            ) as (response, chunks):
+                response.raise_for_status()
                 
-                # Show section summaries
-                for section_name, section_data in report['sections'].items():
-                    print(f"\n📌 {section_name.replace('_', ' ').title()}:")
-                    if isinstance(section_data, dict):
-                        for key in list(section_data.keys())[:2]:  # First 2 keys
-                            print(f"    - {key}")
-                    elif isinstance(section_data, list):
-                        print(f"    - {len(section_data)} items")
-                    else:
-                        print(f"    - {str(section_data)[:100]}...")
+                if format_type == "json" and not save and IJSON_AVAILABLE:
+                    # Only the summary is shown, so parse just those fields as the body streams in
+                    self._print_report(*self._stream_report_summary(chunks))
                 
-                # Save if requested
-                if save:
-                    filename = f"{report['report_id']}.json"
-                    with open(filename, 'w') as f:
-                        json.dump(report, f, indent=2)
-                    print(f"\n💾 Report saved to: {filename}")
-                    
-            else:
-                # Markdown or HTML format
-                content = response.text
-                print(f"✅ Report generated ({len(content)} characters)")
+                elif format_type == "json":
+                    report = json_loads(b"".join(chunks))
+                    self._print_report(report, {
+                        name: summarize_section(data) for name, data in report['sections'].items()
+                    })
                 
-                if save:
-                    ext = "md" if format_type == "markdown" else "html"
-                    filename = f"report_{datetime.now().strftime('%Y%m%d_%H%M%S')}.{ext}"
-                    with open(filename, 'w') as f:
-                        f.write(content)
-                    print(f"\n💾 Report saved to: {filename}")
+                    # Save if requested
+                    if save:
+                        filename = f"{report['report_id']}.json"
+                        write_json(filename, report)
+                        print(f"\n💾 Report saved to: {filename}")
+                    
                 else:
-                    # Show preview
-                    print("\nPreview (first 300 chars):")
-                    print(content[:300] + "...")
+                    # Markdown or HTML format, written to disk as it arrives
+                    if save:
+                        ext = "md" if format_type == "markdown" else "html"
+                        from datetime import datetime
+                        filename = f"report_{datetime.now().strftime('%Y%m%d_%H%M%S')}.{ext}"
+                        size = 0
+                        with open(filename, 'wb') as f:
+                            for chunk in chunks:
+                                f.write(chunk)
+                                size += len(chunk)
+                        print(f"✅ Report generated ({size} bytes)")
+                        print(f"\n💾 Report saved to: {filename}")
+                    else:
+                        # Show preview, reading only as much of the body as it needs
+                        head = b""
+                        for chunk in chunks:
+                            head += chunk
+                            if len(head) >= REPORT_PREVIEW_BYTES:
+                                break
+                        print("✅ Report generated")
+                        print(f"\nPreview (first {REPORT_PREVIEW_BYTES} bytes):")
+                        print(head[:REPORT_PREVIEW_BYTES].decode("utf-8", errors="ignore") + "...")
                     
         except Exception as e:
             print(f"❌ Error: {str(e)}")
@@ -309,7 +698,7 @@ class HDICli:
             response = self.session.get(f"{self.api_url}/reports/types")
             response.raise_for_status()
             
-            data = response.json()
+            data = json_loads(response.content)
             for report_type in data["report_types"]:
                 print(f"📊 {report_type['name']} ({report_type['type']})")
                 print(f"   {report_type['description']}")
@@ -327,7 +716,7 @@ class HDICli:
             response = self.session.get(f"{self.api_url}/reports/templates")
             response.raise_for_status()
             
-            data = response.json()
+            data = json_loads(response.content)
             for template in data["templates"]:
                 print(f"📄 {template['name']}")
                 print(f"   {template['description']}")
@@ -350,6 +739,7 @@ Examples:
   hdi compare "1000 Main St" "2000 Bagby St" "3000 Post Oak"
   hdi market "Houston Heights"
   hdi stats
+  hdi dash --area "Houston Heights" --address "1234 Main St, Houston, TX"
   hdi bulk addresses.txt --type investment
   hdi report daily_market "Heights,Montrose" --save
   hdi report-types
@@ -363,6 +753,12 @@ Examples:
         help="API endpoint URL"
     )
     
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Bypass the local response cache"
+    )
+    
     subparsers = parser.add_subparsers(dest="command", help="Available commands")
     
     # Search command
@@ -384,6 +780,11 @@ Examples:
     # Stats command
     stats_parser = subparsers.add_parser("stats", help="Show usage statistics")
     
+    # Dashboard command
+    dash_parser = subparsers.add_parser("dash", help="Stats, market and property analysis in one request")
+    dash_parser.add_argument("--area", help="Area for market trends")
+    dash_parser.add_argument("--address", help="Property address to analyze")
+    
     # Bulk command
     bulk_parser = subparsers.add_parser("bulk", help="Bulk analyze properties from file")
     bulk_parser.add_argument("file", help="File containing addresses (one per line)")
@@ -422,7 +823,7 @@ Examples:
         return
     
     # Initialize CLI
-    cli = HDICli(args.api_url)
+    cli = HDICli(args.api_url, use_cache=not args.no_cache)
     
     # Execute command
     if args.command == "search":
@@ -435,6 +836,8 @@ Examples:
         cli.market(args.area)
     elif args.command == "stats":
         cli.stats()
+    elif args.command == "dash":
+        cli.dash(args.area, args.address)
     elif args.command == "bulk":
         cli.bulk(args.file, args.type)
     elif args.command == "report":
@@ -1,7 +1,6 @@
 #!/usr/bin/env python3
 """Run HDI Flask application"""
 
-from backend.app import app
 from backend.config.settings import settings
 
 if __name__ == "__main__":
@@ -16,6 +15,9 @@ if __name__ == "__main__":
         print(f"✗ Settings validation failed: {e}")
         exit(1)
     
+    # Build the app only once the settings are known to be valid
+    from backend.app import app
+    
     # Run app
     print(f"\n🚀 Starting HDI API on http://{settings.API_HOST}:{settings.API_PORT}")
     print(f"📚 API Docs: http://{settings.API_HOST}:{settings.API_PORT}/docs\n")
@@ -6,32 +6,90 @@ import sys
 import os
 import time
 import signal
+import socket
 from pathlib import Path
 
+# Project root, resolved once for every subprocess launch
+ROOT = Path(__file__).resolve().parent
+
+API_HOST = "localhost"
+API_PORT = 5000
+API_STARTUP_TIMEOUT = 30  # seconds
+
 def start_api():
     """Start the Flask API server"""
     print("🚀 Starting HDI API server...")
     return subprocess.Popen([
         sys.executable, "-m", "backend.app"
-    ], cwd=Path(__file__).parent)
+    ], cwd=ROOT)
 
 def start_dashboard():
     """Start the Streamlit dashboard"""
     print("🎨 Starting HDI Dashboard...")
-    dashboard_script = Path(__file__).parent / "frontend" / "run_dashboard.py"
+    dashboard_script = ROOT / "frontend" / "run_dashboard.py"
     return subprocess.Popen([
         sys.executable, str(dashboard_script)
-    ], cwd=Path(__file__).parent)
+    ], cwd=ROOT)
+
+_health_session = None
+
+def get_health_session():
+    """Session shared by the startup health checks, so polls reuse one connection"""
+    global _health_session
+    if _health_session is None:
+        import requests
+        _health_session = requests.Session()
+    return _health_session
 
 def check_api_health():
     """Check if API is responding"""
-    import requests
     try:
-        response = requests.get("http://localhost:5000/health", timeout=5)
+        response = get_health_session().get(f"http://{API_HOST}:{API_PORT}/health", timeout=5)
         return response.status_code == 200
     except:
         return False
 
+def api_port_open():
+    """Check if anything accepts TCP connections on the API port yet"""
+    try:
+        with socket.create_connection((API_HOST, API_PORT), timeout=0.2):
+            return True
+    except OSError:
+        return False
+
+def wait_for_api(timeout=API_STARTUP_TIMEOUT):
+    """Wait until the API is healthy, polling from 50ms backing off to 1s"""
+    delay = 0.05
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        # The HTTP health check only runs once the port is listening
+        if api_port_open() and check_api_health():
+            return True
+        time.sleep(delay)
+        delay = min(delay * 1.5, 1.0)
+    return False
+
+def wait_for_exit(processes):
+    """Block until one of the processes exits and return it"""
+    if hasattr(os, "waitid"):
+        # Sleeps in the kernel until a child exits; WNOWAIT leaves it
+        # unreaped so Popen can still collect its exit status
+        while True:
+            info = os.waitid(os.P_ALL, 0, os.WEXITED | os.WNOWAIT)
+            for process in processes:
+                if info.si_pid == process.pid:
+                    process.wait()
+                    return process
+            # Not one of ours: reap it so the next waitid does not return it again
+            os.waitpid(info.si_pid, 0)
+    
+    # No waitid (Windows, older macOS): poll once a second
+    while True:
+        time.sleep(1)
+        for process in processes:
+            if process.poll() is not None:
+                return process
+
 def main():
     """Launch HDI platform"""
     print("🏠 HDI Platform Launcher")
@@ -42,15 +100,12 @@ def main():
     
     # Wait for API to be ready
     print("⏳ Waiting for API to start...")
-    for i in range(30):  # Wait up to 30 seconds
-        time.sleep(1)
-        if check_api_health():
-            print("✅ API is ready!")
-            break
-        if i == 29:
-            print("❌ API failed to start")
-            api_process.terminate()
-            return
+    if wait_for_api():
+        print("✅ API is ready!")
+    else:
+        print("❌ API failed to start")
+        api_process.terminate()
+        return
     
     # Start dashboard
     dashboard_process = start_dashboard()
@@ -62,18 +117,12 @@ def main():
     print("\n⚠️  Press Ctrl+C to stop all services")
     
     try:
-        # Keep running until interrupted
-        while True:
-            time.sleep(1)
-            
-            # Check if processes are still running
-            if api_process.poll() is not None:
-                print("❌ API process stopped unexpectedly")
-                break
-            
-            if dashboard_process.poll() is not None:
-                print("❌ Dashboard process stopped unexpectedly")
-                break
+        # Keep running until interrupted or a process stops
+        stopped = wait_for_exit([api_process, dashboard_process])
+        if stopped is api_process:
+            print("❌ API process stopped unexpectedly")
+        else:
+            print("❌ Dashboard process stopped unexpectedly")
     
     except KeyboardInterrupt:
         print("\n🛑 Stopping HDI Platform...")
@@ -4,31 +4,34 @@
 import os
 import sys
 
-# Debug: Print environment info
-print(f"Working directory: {os.getcwd()}")
-print(f"Files in /app: {os.listdir('/app') if os.path.exists('/app') else 'N/A'}")
-print(f"Files in current dir: {os.listdir('.')}")
-
 # Set up Python path
 current_dir = os.path.dirname(os.path.abspath(__file__))
 sys.path.insert(0, current_dir)
-
-# Debug: Check if backend directory exists
 backend_path = os.path.join(current_dir, 'backend')
-print(f"Backend path exists: {os.path.exists(backend_path)}")
-if os.path.exists(backend_path):
-    print(f"Files in backend: {os.listdir(backend_path)}")
-    services_path = os.path.join(backend_path, 'services')
-    if os.path.exists(services_path):
-        print(f"Files in services: {os.listdir(services_path)}")
+
+# Debug: Print environment info; every worker imports this module, so the
+# directory scans only run when asked for
+if os.environ.get('HDI_WSGI_DEBUG') == '1':
+    print(f"Working directory: {os.getcwd()}")
+    print(f"Files in /app: {os.listdir('/app') if os.path.exists('/app') else 'N/A'}")
+    print(f"Files in current dir: {os.listdir('.')}")
+    print(f"Backend path exists: {os.path.exists(backend_path)}")
+    if os.path.exists(backend_path):
+        print(f"Files in backend: {os.listdir(backend_path)}")
+        services_path = os.path.join(backend_path, 'services')
+        if os.path.exists(services_path):
+            print(f"Files in services: {os.listdir(services_path)}")
 
 # Import the app
 try:
-    from backend.app import create_app
-    app = create_app()
+    # backend.app builds the app on import; calling create_app() here
+    # again would build and register everything a second time
+    from backend.app import app
     print("✓ Successfully imported and created HDI app")
 except ImportError as e:
     print(f"✗ Import error: {e}")
+    # `e` is unbound once the except block ends, so keep the message for the views
+    import_error = str(e)
     print(f"Python path: {sys.path[:5]}")
     
     # Fallback to basic Flask app
@@ -39,7 +42,7 @@ except ImportError as e:
     def health():
         return jsonify({
             "status": "error", 
-            "message": f"HDI API import failed: {e}",
+            "message": f"HDI API import failed: {import_error}",
             "debug": {
                 "working_dir": os.getcwd(),
                 "backend_exists": os.path.exists(backend_path),